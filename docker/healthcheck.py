@@ -6,9 +6,18 @@ Supports both stdio and HTTP transports with appropriate checks.
 Environment Variables:
     FMCP_TRANSPORT__TYPE: Transport type (stdio, streamable-http)
     FMCP_TRANSPORT__PORT: Server port for HTTP transport (default: 8765)
+    FMCP_TRANSPORT__HEALTHCHECK_HOST: Address to probe (default: 127.0.0.1).
+        Override for IPv6-only containers (e.g. ::1) or custom bind addresses.
     FMCP_TRANSPORT__HEALTHCHECK_ENDPOINT: Health endpoint path (default: /_health)
-    FMCP_HEALTHCHECK_TIMEOUT: HTTP request timeout in seconds (default: 2.5)
+    FMCP_HEALTHCHECK_TIMEOUT: HTTP request timeout in seconds (default: 0.5).
+        Connecting uses a shorter 0.2s timeout so a dead server fails fast.
     FMCP_HEALTHCHECK_VERBOSE: Enable verbose logging (default: false)
+    FMCP_HEALTHCHECK_USE_HTTPX: Probe via httpx instead of a raw socket (default: false)
+    FMCP_HEALTHCHECK_FULL_IMPORT: Import fathom_mcp for stdio checks instead of
+        only locating it (default: false)
+    FMCP_HEALTHCHECK_INTERVAL: Poll interval in seconds for daemon mode (default: 10)
+    FMCP_HEALTHCHECK_STATUS_FILE: Status file written in daemon mode
+        (default: /tmp/fathom-mcp-health)
 
 Exit Codes:
     0: Healthy
@@ -16,62 +25,231 @@ Exit Codes:
     2: Configuration error
 
 Usage:
-    python healthcheck.py
+    python healthcheck.py            # One-shot check (default)
+    python healthcheck.py --daemon   # Keep polling and write status file
+
+Daemon mode keeps a single process alive across probes
+and writes "healthy" or "unhealthy" to the status file after every poll.
+The image does not start it; launch it next to the server (see "Healthcheck
+daemon" in README.md) and have Docker HEALTHCHECK read the file instead of
+starting a new interpreter each time. Also check the file's age, so a dead
+daemon does not leave a stale "healthy" behind:
+
+    HEALTHCHECK CMD test -n "$(find /tmp/fathom-mcp-health -mmin -1)" \\
+        && grep -qx healthy /tmp/fathom-mcp-health
 """
 
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
 import logging
 import os
+import socket
 import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import httpx
 
-# Configure logging (stderr for Docker visibility)
-def setup_logging() -> logging.Logger:
-    """Set up logging for healthcheck.
 
-    Logs to stderr for Docker container visibility.
-    Only logs warnings/errors by default (unless verbose mode enabled).
+# Configure logging (stderr for Docker visibility). Only warnings/errors are
+# logged unless verbose mode is enabled; basicConfig is skipped if the root
+# logger was already configured.
+def _env_flag(name: str) -> bool:
+    """Read a boolean environment variable (true/1/yes, case-insensitive)."""
+    return os.getenv(name, "false").lower() in ("true", "1", "yes")
 
-    Returns:
-        Configured logger instance
-    """
-    verbose = os.getenv("FMCP_HEALTHCHECK_VERBOSE", "false").lower() in (
-        "true",
-        "1",
-        "yes",
-    )
-    level = logging.INFO if verbose else logging.WARNING
 
+_VERBOSE = _env_flag("FMCP_HEALTHCHECK_VERBOSE")
+
+if not logging.getLogger().handlers:
     logging.basicConfig(
-        level=level,
+        level=logging.INFO if _VERBOSE else logging.WARNING,
         format="%(asctime)s [HEALTHCHECK] %(levelname)s: %(message)s",
         stream=sys.stderr,
     )
-    return logging.getLogger(__name__)
+
+logger = logging.getLogger(__name__)
+
+# Default request timeout and (shorter) connect timeout, in seconds. The
+# local health endpoint normally answers in a few milliseconds.
+_DEFAULT_TIMEOUT = 0.5
+_CONNECT_TIMEOUT = 0.2
+
+# Upper bound on bytes read from the health endpoint
+_MAX_RESPONSE_BYTES = 64 * 1024
+
+# Packages fathom_mcp's top-level import must not pull in; they belong to the
+# inspector/client side and would dominate healthcheck startup time
+_FORBIDDEN_IMPORTS = frozenset({"streamlit", "pandas", "httpx"})
+
+# httpx client reused across probes when FMCP_HEALTHCHECK_USE_HTTPX is set
+# (only benefits daemon mode, where the process outlives a single check)
+_http_client: httpx.Client | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class HealthConfig:
+    """Healthcheck settings parsed from the environment.
+
+    Built once at import so daemon mode does not re-parse the environment
+    on every probe.
+    """
+
+    transport: str
+    port: int
+    path: str
+    timeout: float
+    host: str
+    use_httpx: bool
+    full_import: bool
+
+
+def _load_config() -> HealthConfig:
+    """Parse and validate healthcheck settings from the environment.
+
+    An out-of-range or malformed timeout falls back to the default with a
+    warning; every other invalid value is a configuration error.
+
+    Returns:
+        Validated HealthConfig
+
+    Raises:
+        ValueError: If the transport type, or the port for HTTP transport, is invalid
+    """
+    transport = os.getenv("FMCP_TRANSPORT__TYPE", "stdio")
+    if transport not in ("stdio", "streamable-http"):
+        raise ValueError(
+            f"Invalid FMCP_TRANSPORT__TYPE: '{transport}'. Must be 'stdio' or 'streamable-http'"
+        )
+
+    # Only the HTTP check uses the port; stdio keeps the default unvalidated
+    port = 8765
+    if transport == "streamable-http":
+        try:
+            port = int(os.getenv("FMCP_TRANSPORT__PORT", "8765"))
+        except ValueError as e:
+            raise ValueError(f"Invalid port in FMCP_TRANSPORT__PORT: {e}") from e
+        if not (1024 <= port <= 65535):
+            raise ValueError(f"Invalid port number: {port} (must be 1024-65535)")
+
+    try:
+        timeout = float(os.getenv("FMCP_HEALTHCHECK_TIMEOUT", str(_DEFAULT_TIMEOUT)))
+        if timeout <= 0 or timeout > 10:
+            logger.warning(f"Invalid timeout {timeout}s, using default {_DEFAULT_TIMEOUT}s")
+            timeout = _DEFAULT_TIMEOUT
+    except ValueError:
+        logger.warning(f"Invalid FMCP_HEALTHCHECK_TIMEOUT, using default {_DEFAULT_TIMEOUT}s")
+        timeout = _DEFAULT_TIMEOUT
+
+    return HealthConfig(
+        transport=transport,
+        port=port,
+        path=os.getenv("FMCP_TRANSPORT__HEALTHCHECK_ENDPOINT", "/_health"),
+        timeout=timeout,
+        # Probe an IP literal (healthcheck runs inside the container) to skip
+        # the getaddrinfo lookup for "localhost"
+        host=os.getenv("FMCP_TRANSPORT__HEALTHCHECK_HOST", "127.0.0.1"),
+        use_httpx=_env_flag("FMCP_HEALTHCHECK_USE_HTTPX"),
+        full_import=_env_flag("FMCP_HEALTHCHECK_FULL_IMPORT"),
+    )
 
 
-logger = setup_logging()
+# Parsed once at import; None (with the reason in _CONFIG_ERROR) when the
+# environment is invalid, in which case main() exits with code 2
+_CONFIG: HealthConfig | None
+try:
+    _CONFIG = _load_config()
+    _CONFIG_ERROR = ""
+except ValueError as e:
+    _CONFIG = None
+    _CONFIG_ERROR = str(e)
 
 
-def check_stdio() -> bool:
-    """Check stdio transport health (module import only).
+def _get_http_client(host: str, port: int, timeout: float) -> httpx.Client:
+    """Get the cached HTTP client, creating it on first use.
 
-    For stdio transport, we can only verify the module is importable.
+    The client connects to an IP literal (no DNS lookup) but sends
+    ``Host: localhost`` so server-side host checks behave as before.
+
+    Args:
+        host: Address literal to connect to
+        port: Server port
+        timeout: Request timeout in seconds
+
+    Returns:
+        Shared httpx.Client bound to the local server
+    """
+    global _http_client
+
+    import httpx
+
+    if _http_client is None:
+        _http_client = httpx.Client(
+            base_url=f"http://{_format_host(host)}:{port}",
+            headers={"Host": f"localhost:{port}"},
+            timeout=httpx.Timeout(timeout, connect=min(_CONNECT_TIMEOUT, timeout)),
+            transport=httpx.HTTPTransport(retries=0),
+        )
+    return _http_client
+
+
+def _format_host(host: str) -> str:
+    """Wrap IPv6 literals in brackets for use in a URL."""
+    return f"[{host}]" if ":" in host and not host.startswith("[") else host
+
+
+def check_stdio(config: HealthConfig) -> bool:
+    """Check stdio transport health (module availability only).
+
+    For stdio transport, we can only verify the module is installed.
     The actual server process runs as a subprocess of the MCP client
     (e.g., Claude Desktop), so we cannot directly check its health
     from a separate healthcheck process.
 
-    This basic check ensures:
-    - Python environment is correctly set up
-    - Module is installed and importable
-    - Core dependencies are available
+    By default this only locates the package (importlib.util.find_spec)
+    without executing it. Set FMCP_HEALTHCHECK_FULL_IMPORT=1 to import it,
+    which additionally verifies that its top-level code and dependencies load
+    and that it does not drag in heavy client-side packages (_FORBIDDEN_IMPORTS).
+    Run ``python -X importtime -c "import fathom_mcp"`` for a per-module audit.
+
+    Args:
+        config: Healthcheck settings
 
     Returns:
-        True if fathom_mcp module can be imported successfully
+        True if fathom_mcp module can be found (or imported) successfully
     """
     try:
+        if not config.full_import:
+            if importlib.util.find_spec("fathom_mcp") is None:
+                logger.error("fathom_mcp module not found")
+                return False
+            logger.info("fathom_mcp module found")
+            return True
+
+        before = set(sys.modules)
+        start = time.perf_counter()
         import fathom_mcp  # noqa: F401
 
-        logger.info("fathom_mcp module imported successfully")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        loaded = {name.partition(".")[0] for name in sys.modules.keys() - before}
+        logger.info(
+            f"fathom_mcp module imported successfully in {elapsed_ms:.1f}ms "
+            f"(new top-level packages: {', '.join(sorted(loaded)) or 'none'})"
+        )
+
+        forbidden = loaded & _FORBIDDEN_IMPORTS
+        if forbidden:
+            logger.error(
+                f"Importing fathom_mcp pulled in {', '.join(sorted(forbidden))}; "
+                "fathom_mcp/__init__.py must stay import-light"
+            )
+            return False
         return True
     except ImportError as e:
         logger.error(f"Failed to import fathom_mcp: {e}")
@@ -81,7 +259,74 @@ def check_stdio() -> bool:
         return False
 
 
-def check_http() -> bool:
+def _raw_http_get(host: str, port: int, path: str, timeout: float) -> tuple[int, bytes]:
+    """Send a minimal HTTP/1.0 GET over a plain socket.
+
+    Avoids importing an HTTP client library (and its dependency tree) in a
+    process that only ever issues one localhost request.
+
+    Args:
+        host: Address literal to connect to
+        port: Server port
+        path: Request path
+        timeout: Read timeout in seconds (connect uses _CONNECT_TIMEOUT)
+
+    Returns:
+        Tuple of (status code, response body)
+
+    Raises:
+        OSError: On connection failure or timeout
+        ValueError: If the response has no valid status line
+    """
+    request = (
+        f"GET {path} HTTP/1.0\r\nHost: localhost:{port}\r\nConnection: close\r\n\r\n"
+    ).encode("ascii")
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+
+    chunks: list[bytes] = []
+    received = 0
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(min(_CONNECT_TIMEOUT, timeout))
+        sock.connect((host, port))
+        sock.settimeout(timeout)
+        sock.sendall(request)
+        while received < _MAX_RESPONSE_BYTES:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+
+    head, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0].split(None, 2)
+    if len(status_line) < 2 or not status_line[0].startswith(b"HTTP/"):
+        raise ValueError(f"Malformed HTTP status line: {head[:80]!r}")
+    return int(status_line[1]), body
+
+
+def _httpx_get(host: str, port: int, path: str, timeout: float) -> tuple[int, bytes]:
+    """Send the health request through httpx (FMCP_HEALTHCHECK_USE_HTTPX=1).
+
+    httpx errors are translated to the builtin exceptions raised by
+    _raw_http_get so both paths share the same error handling.
+
+    Returns:
+        Tuple of (status code, response body)
+    """
+    import httpx
+
+    try:
+        response = _get_http_client(host, port, timeout).get(path)
+    except httpx.TimeoutException as e:
+        raise TimeoutError(str(e)) from e
+    except httpx.ConnectError as e:
+        raise ConnectionError(str(e)) from e
+    except httpx.RequestError as e:
+        raise OSError(str(e)) from e
+    return response.status_code, response.content
+
+
+def check_http(config: HealthConfig) -> bool:
     """Check HTTP transport health via healthcheck endpoint.
 
     Sends GET request to the configured health endpoint and validates:
@@ -89,60 +334,46 @@ def check_http() -> bool:
     - Response body indicates healthy status (if JSON)
     - Connection succeeds within timeout
 
+    Uses a raw socket request by default; set FMCP_HEALTHCHECK_USE_HTTPX=1
+    to go through httpx instead.
+
+    Args:
+        config: Healthcheck settings
+
     Returns:
         True if health endpoint returns 200 and server is healthy
     """
     # Check httpx availability
-    try:
-        import httpx
-    except ImportError:
-        logger.error(
-            "httpx not installed - cannot check HTTP health. "
-            "This should not happen in Docker container. "
-            "Verify pyproject.toml includes httpx in dependencies."
-        )
-        return False
-
-    # Get and validate port configuration
-    try:
-        port = int(os.getenv("FMCP_TRANSPORT__PORT", "8765"))
-        if not (1024 <= port <= 65535):
-            logger.error(f"Invalid port number: {port} (must be 1024-65535)")
+    if config.use_httpx:
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            logger.error(
+                "httpx not installed - cannot check HTTP health. "
+                "This should not happen in Docker container. "
+                "Verify pyproject.toml includes httpx in dependencies."
+            )
             return False
-    except ValueError as e:
-        logger.error(f"Invalid port in FMCP_TRANSPORT__PORT: {e}")
-        return False
-
-    # Get health endpoint path (support customization)
-    healthcheck_path = os.getenv("FMCP_TRANSPORT__HEALTHCHECK_ENDPOINT", "/_health")
 
-    # Get timeout (faster timeout for healthcheck - default 2.5s)
-    try:
-        timeout = float(os.getenv("FMCP_HEALTHCHECK_TIMEOUT", "2.5"))
-        if timeout <= 0 or timeout > 10:
-            logger.warning(f"Invalid timeout {timeout}s, using default 2.5s")
-            timeout = 2.5
-    except ValueError:
-        logger.warning("Invalid FMCP_HEALTHCHECK_TIMEOUT, using default 2.5s")
-        timeout = 2.5
-
-    # Build health URL (localhost since healthcheck runs inside container)
-    health_url = f"http://localhost:{port}{healthcheck_path}"
+    host, port, timeout = config.host, config.port, config.timeout
+    health_url = f"http://{_format_host(host)}:{port}{config.path}"
     logger.info(f"Checking health at {health_url} (timeout={timeout}s)")
 
     # Perform health check with specific error handling
+    http_get = _httpx_get if config.use_httpx else _raw_http_get
     try:
-        response = httpx.get(health_url, timeout=timeout)
+        status_code, body = http_get(host, port, config.path, timeout)
 
-        if response.status_code != 200:
+        if status_code != 200:
             logger.warning(
-                f"Health endpoint returned {response.status_code}: {response.text[:200]}"
+                f"Health endpoint returned {status_code}: "
+                f"{body[:200].decode('utf-8', errors='replace')}"
             )
             return False
 
         # Optional: Validate response body if JSON
         try:
-            health_data = response.json()
+            health_data = json.loads(body)
             status = health_data.get("status", "unknown")
 
             if status != "healthy":
@@ -157,56 +388,43 @@ def check_http() -> bool:
 
         return True
 
-    except httpx.TimeoutException:
+    except TimeoutError:
         logger.warning(f"Health check timed out after {timeout}s")
         return False
 
-    except httpx.ConnectError as e:
+    except ConnectionError as e:
         logger.warning(f"Cannot connect to server at {health_url}: {e}")
         return False
 
-    except httpx.HTTPStatusError as e:
-        logger.warning(f"HTTP status error: {e}")
-        return False
-
-    except httpx.RequestError as e:
-        logger.warning(f"Request error during health check: {e}")
-        return False
-
     except OSError as e:
         logger.warning(f"OS error during health check: {e}")
         return False
 
+    except ValueError as e:
+        logger.warning(f"Invalid response from health endpoint: {e}")
+        return False
+
     except Exception as e:
         # Unexpected error - log with traceback for debugging
         logger.error(f"Unexpected error during health check: {e}", exc_info=True)
         return False
 
 
-def main() -> int:
-    """Main healthcheck logic.
+def run_check(config: HealthConfig) -> int:
+    """Run a single health check.
+
+    Runs the appropriate health check based on transport type.
 
-    Validates configuration and runs appropriate health check
-    based on transport type.
+    Args:
+        config: Healthcheck settings
 
     Returns:
-        0 if healthy, 1 if unhealthy, 2 if configuration error
+        0 if healthy, 1 if unhealthy
     """
-    # Get transport type from environment
-    transport_type = os.getenv("FMCP_TRANSPORT__TYPE", "stdio")
-
-    # Validate transport type
-    if transport_type not in ("stdio", "streamable-http"):
-        logger.error(
-            f"Invalid FMCP_TRANSPORT__TYPE: '{transport_type}'. "
-            f"Must be 'stdio' or 'streamable-http'"
-        )
-        return 2
-
-    logger.info(f"Checking health for transport: {transport_type}")
+    logger.info(f"Checking health for transport: {config.transport}")
 
     # Run appropriate health check
-    healthy = check_stdio() if transport_type == "stdio" else check_http()
+    healthy = check_stdio(config) if config.transport == "stdio" else check_http(config)
 
     # Return exit code
     if healthy:
@@ -217,5 +435,73 @@ def main() -> int:
         return 1
 
 
+def run_daemon(config: HealthConfig, status_file: Path, interval: float) -> None:
+    """Poll health forever, writing the latest status to a file.
+
+    The file is replaced atomically so readers never see a partial write.
+    A check that raises counts as unhealthy, and a failed write is logged
+    without stopping the loop.
+
+    Args:
+        config: Healthcheck settings
+        status_file: File receiving "healthy" or "unhealthy"
+        interval: Seconds between polls
+    """
+    logger.info(f"Starting healthcheck daemon (interval={interval}s, file={status_file})")
+    tmp_file = status_file.with_name(status_file.name + ".tmp")
+
+    while True:
+        try:
+            exit_code = run_check(config)
+        except Exception as e:
+            logger.error(f"Unexpected error during health check: {e}", exc_info=True)
+            exit_code = 1
+
+        try:
+            tmp_file.write_text("healthy\n" if exit_code == 0 else "unhealthy\n")
+            tmp_file.replace(status_file)
+        except OSError as e:
+            # Keep polling: the next write may succeed once space or the directory is back
+            logger.error(f"Cannot write status file {status_file}: {e}")
+
+        time.sleep(interval)
+
+
+def main() -> int:
+    """Main healthcheck entry point.
+
+    Runs a one-shot check unless --daemon is given.
+
+    Returns:
+        0 if healthy, 1 if unhealthy, 2 if configuration error
+    """
+    parser = argparse.ArgumentParser(description="fathom-mcp Docker healthcheck")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep polling and write status to FMCP_HEALTHCHECK_STATUS_FILE",
+    )
+    args = parser.parse_args()
+
+    if _CONFIG is None:
+        logger.error(_CONFIG_ERROR)
+        return 2
+
+    if not args.daemon:
+        return run_check(_CONFIG)
+
+    try:
+        interval = float(os.getenv("FMCP_HEALTHCHECK_INTERVAL", "10"))
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+    except ValueError as e:
+        logger.error(f"Invalid FMCP_HEALTHCHECK_INTERVAL: {e}")
+        return 2
+
+    status_file = Path(os.getenv("FMCP_HEALTHCHECK_STATUS_FILE", "/tmp/fathom-mcp-health"))
+    run_daemon(_CONFIG, status_file, interval)
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
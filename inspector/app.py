@@ -8,19 +8,17 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-# Add inspector directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
-import streamlit as st
-from components.sidebar import render_sidebar
-from components.tool_forms import render_tool_section
-from mcp_client import (
-    MCPClientError,
-    get_log_collector,
-    list_prompts,
-    list_resources,
-    read_resource,
-)
+# Add inspector directory to path for imports (once per process; Streamlit
+# re-executes this script on every rerun)
+_INSPECTOR_DIR = str(Path(__file__).parent)
+if _INSPECTOR_DIR not in sys.path:
+    sys.path.insert(0, _INSPECTOR_DIR)
+
+import streamlit as st  # noqa: E402
+from components.sidebar import render_sidebar  # noqa: E402
+
+# Maximum number of log lines shown in the Logs tab
+_MAX_LOG_LINES = 2000
 
 # Page configuration
 st.set_page_config(
@@ -51,7 +49,10 @@ def main() -> None:
         ["🛠️ Tools", "📁 Resources", "💬 Prompts", "📋 Logs"]
     )
 
+    # Tab-specific modules are imported where they are used
     with tab_tools:
+        from components.tool_forms import render_tool_section
+
         render_tool_section()
 
     with tab_resources:
@@ -64,8 +65,12 @@ def main() -> None:
         _render_logs_section()
 
 
+@st.fragment
 def _render_resources_section() -> None:
-    """Render the resources section."""
+    """Render the resources section.
+
+    Runs as a fragment so its buttons rerun only this section.
+    """
     if not st.session_state.get("connected"):
         st.info("Please connect to an MCP server first using the sidebar.")
         return
@@ -74,11 +79,15 @@ def _render_resources_section() -> None:
     if not config:
         return
 
+    from client_cache import cached_list_resources
+    from mcp_client import MCPClientError, read_resource
+
     # Fetch resources button
     if st.button("Refresh Resources"):
+        cached_list_resources.clear()
         with st.spinner("Fetching resources..."):
             try:
-                resources = list_resources(config)
+                resources = cached_list_resources(config)
                 st.session_state["resources"] = resources
             except MCPClientError as e:
                 st.error(f"Failed to fetch resources: {e}")
@@ -111,8 +120,12 @@ def _render_resources_section() -> None:
                         st.error(f"Failed to read resource: {e}")
 
 
+@st.fragment
 def _render_prompts_section() -> None:
-    """Render the prompts section."""
+    """Render the prompts section.
+
+    Runs as a fragment so its buttons rerun only this section.
+    """
     if not st.session_state.get("connected"):
         st.info("Please connect to an MCP server first using the sidebar.")
         return
@@ -121,11 +134,15 @@ def _render_prompts_section() -> None:
     if not config:
         return
 
+    from client_cache import cached_list_prompts
+    from mcp_client import MCPClientError
+
     # Fetch prompts button
     if st.button("Refresh Prompts"):
+        cached_list_prompts.clear()
         with st.spinner("Fetching prompts..."):
             try:
-                prompts = list_prompts(config)
+                prompts = cached_list_prompts(config)
                 st.session_state["prompts"] = prompts
             except MCPClientError as e:
                 st.error(f"Failed to fetch prompts: {e}")
@@ -155,20 +172,26 @@ def _render_prompts_section() -> None:
                     st.markdown(f"- `{arg_name}`{req_str}: {arg_desc}")
 
 
+@st.fragment
 def _render_logs_section() -> None:
-    """Render the logs section."""
+    """Render the logs section.
+
+    Runs as a fragment: any widget interaction reruns only this section,
+    which re-reads the collector, so no full-app rerun is needed.
+    """
+    from mcp_client import get_log_collector
+
     collector = get_log_collector()
 
     col1, col2, col3, col4 = st.columns([1, 1, 1.5, 1.5])
 
     with col1:
-        if st.button("Refresh Logs"):
-            st.rerun()
+        # Clicking reruns the fragment, which is all a refresh needs
+        st.button("Refresh Logs")
 
     with col2:
         if st.button("Clear Logs"):
             collector.clear()
-            st.rerun()
 
     with col3:
         filter_level = st.selectbox(
@@ -188,23 +211,18 @@ def _render_logs_section() -> None:
 
     st.markdown("---")
 
-    entries = collector.get_all()
-
-    if not entries:
+    if collector.count() == 0:
         st.info("No logs yet. Connect to a server and execute some tools.")
         return
 
-    # Filter entries by level
-    if filter_level != "All":
-        entries = [e for e in entries if e.level == filter_level]
-
-    # Filter entries by source
-    if filter_source != "All":
-        entries = [e for e in entries if e.source == filter_source]
+    level = None if filter_level == "All" else filter_level
+    source = None if filter_source == "All" else filter_source
 
-    st.markdown(f"**{len(entries)} log entries**")
+    st.markdown(f"**{collector.count(level, source)} log entries**")
 
-    # Display logs in reverse order (newest first)
+    # Display logs in reverse order (newest first), capped so the code block
+    # stays cheap to render in the browser
+    entries = collector.get_filtered(level, source, limit=_MAX_LOG_LINES)
     log_text = "\n".join(entry.format() for entry in reversed(entries))
 
     st.code(log_text, language="log")
@@ -0,0 +1,45 @@
+"""Streamlit-cached wrappers around MCP client metadata calls.
+
+The mcp_client functions already reuse one persistent server session per
+knowledge root. These wrappers additionally keep listing results per
+ServerConfig for a few minutes, so Streamlit reruns don't issue requests
+at all; Refresh buttons clear the relevant cache explicitly.
+"""
+
+from __future__ import annotations
+
+import streamlit as st
+from mcp_client import (
+    PromptInfo,
+    ResourceInfo,
+    ServerConfig,
+    close_session,
+    list_prompts,
+    list_resources,
+)
+
+# Seconds before cached metadata is fetched again
+CACHE_TTL = 300
+
+# Hash configs by their fields only; cached properties in the instance
+# __dict__ must not change the cache key
+_HASH_FUNCS = {ServerConfig: lambda c: (c.command, c.root_path, c.working_dir)}
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=_HASH_FUNCS)
+def cached_list_resources(config: ServerConfig) -> list[ResourceInfo]:
+    """List resources for a server (cached)."""
+    return list_resources(config)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=_HASH_FUNCS)
+def cached_list_prompts(config: ServerConfig) -> list[PromptInfo]:
+    """List prompts for a server (cached)."""
+    return list_prompts(config)
+
+
+def clear_client_cache(config: ServerConfig) -> None:
+    """Drop one server's cached metadata and close its session (e.g. on disconnect)."""
+    cached_list_resources.clear(config)
+    cached_list_prompts.clear(config)
+    close_session(config)
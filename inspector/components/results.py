@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import json
+from collections.abc import Callable
 from typing import Any
 
+import pandas as pd
 import streamlit as st
 
+# Search matches rendered as expanders with context; the rest form a table
+_EXPANDED_MATCHES = 3
+
 
 def render_result(result: dict[str, Any]) -> None:
     """Render a tool result with multiple display options."""
@@ -26,32 +32,44 @@ def render_result(result: dict[str, Any]) -> None:
         _render_raw(result)
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _to_pretty_json(result: dict[str, Any]) -> str:
+    """Serialize a result once per unique payload (cached across reruns)."""
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 def _render_json(result: dict[str, Any]) -> None:
     """Render result as formatted JSON."""
-    st.json(result)
+    st.json(_to_pretty_json(result))
 
 
 def _render_raw(result: dict[str, Any]) -> None:
     """Render result as raw text."""
-    st.code(json.dumps(result, indent=2, ensure_ascii=False), language="json")
+    st.code(_to_pretty_json(result), language="json")
 
 
 def _render_formatted(result: dict[str, Any]) -> None:
     """Render result in a formatted, human-readable way."""
-    # Detect result type and render appropriately
-    if "matches" in result:
-        _render_search_results(result)
-    elif "collections" in result or "documents" in result:
-        _render_browse_results(result)
-    elif "content" in result:
-        _render_document_content(result)
-    elif "name" in result and "path" in result:
-        _render_document_info(result)
-    elif "results" in result:
-        _render_find_results(result)
-    else:
+    # Detect result type from its keys and render appropriately
+    index = _renderer_index(frozenset(result))
+    if index is None:
         # Fallback to JSON
         st.json(result)
+    else:
+        _RENDERERS[index][1](result)
+
+
+@functools.lru_cache(maxsize=64)
+def _renderer_index(keys: frozenset[str]) -> int | None:
+    """Pick the first _RENDERERS entry whose keys are all present.
+
+    Cached per result shape, so repeated renders of the same tool's output
+    skip the scan.
+    """
+    for index, (required, _) in enumerate(_RENDERERS):
+        if required <= keys:
+            return index
+    return None
 
 
 def _render_search_results(result: dict[str, Any]) -> None:
@@ -69,17 +87,16 @@ def _render_search_results(result: dict[str, Any]) -> None:
         st.info("No matches found.")
         return
 
-    # Render each match
-    for i, match in enumerate(matches):
+    # Expand the top matches with context; the rest go into one table
+    for match in matches[:_EXPANDED_MATCHES]:
         with st.expander(
             f"**{match.get('document', 'Unknown')}** : line {match.get('line', '?')}",
-            expanded=(i < 3),
+            expanded=True,
         ):
             # Context before
             context_before = match.get("context_before", [])
             if context_before:
-                for ctx in context_before:
-                    st.text(f"  {ctx}")
+                st.code("\n".join(context_before), language=None)
 
             # Matched line (highlighted)
             text = match.get("text", "")
@@ -88,8 +105,24 @@ def _render_search_results(result: dict[str, Any]) -> None:
             # Context after
             context_after = match.get("context_after", [])
             if context_after:
-                for ctx in context_after:
-                    st.text(f"  {ctx}")
+                st.code("\n".join(context_after), language=None)
+
+    remaining = matches[_EXPANDED_MATCHES:]
+    if remaining:
+        st.markdown(f"**{len(remaining)} more matches**")
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "document": match.get("document", "Unknown"),
+                        "line": match.get("line"),
+                        "text": match.get("text", ""),
+                    }
+                    for match in remaining
+                ]
+            ),
+            hide_index=True,
+        )
 
 
 def _render_browse_results(result: dict[str, Any]) -> None:
@@ -97,27 +130,43 @@ def _render_browse_results(result: dict[str, Any]) -> None:
     current_path = result.get("current_path", "/")
     st.markdown(f"**Current Path:** `{current_path}`")
 
-    # Collections
     collections = result.get("collections", [])
+    documents = result.get("documents", [])
+
+    # Collections (tables are sent to the browser as one Arrow payload each)
     if collections:
         st.markdown("### Collections")
-        for coll in collections:
-            name = coll.get("name", "Unknown")
-            path = coll.get("path", "")
-            doc_count = coll.get("document_count", 0)
-            sub_count = coll.get("subcollection_count", 0)
-            st.markdown(f"- **{name}** (`{path}`) - {doc_count} docs, {sub_count} subcollections")
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "name": coll.get("name", "Unknown"),
+                        "path": coll.get("path", ""),
+                        "docs": coll.get("document_count", 0),
+                        "subs": coll.get("subcollection_count", 0),
+                    }
+                    for coll in collections
+                ]
+            ),
+            hide_index=True,
+        )
 
     # Documents
-    documents = result.get("documents", [])
     if documents:
         st.markdown("### Documents")
-        for doc in documents:
-            name = doc.get("name", "Unknown")
-            size = doc.get("size_bytes", 0)
-            modified = doc.get("modified", "")
-            size_str = _format_size(size)
-            st.markdown(f"- **{name}** ({size_str}) - {modified}")
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "name": doc.get("name", "Unknown"),
+                        "size": _format_size(doc.get("size_bytes", 0)),
+                        "modified": doc.get("modified", ""),
+                    }
+                    for doc in documents
+                ]
+            ),
+            hide_index=True,
+        )
 
     if not collections and not documents:
         st.info("Empty collection.")
@@ -171,17 +220,28 @@ def _render_document_info(result: dict[str, Any]) -> None:
         _render_toc(toc)
 
 
-def _render_toc(toc: list[dict[str, Any]], level: int = 0) -> None:
-    """Render table of contents recursively."""
-    indent = "  " * level
-    for item in toc:
+def _render_toc(toc: list[dict[str, Any]]) -> None:
+    """Render table of contents as a single nested markdown list."""
+    st.markdown("\n".join(_toc_lines(toc)))
+
+
+def _toc_lines(toc: list[dict[str, Any]]) -> list[str]:
+    """Flatten table of contents into indented markdown list lines.
+
+    Uses an explicit stack (depth-first, document order) rather than
+    recursion, so deeply nested outlines cost no extra call frames.
+    """
+    lines = []
+    stack = [(item, 0) for item in reversed(toc)]
+    while stack:
+        item, level = stack.pop()
         title = item.get("title", "Untitled")
         page = item.get("page", "?")
-        st.markdown(f"{indent}- **{title}** (p. {page})")
+        lines.append(f"{'  ' * level}- **{title}** (p. {page})")
 
         children = item.get("children", [])
-        if children:
-            _render_toc(children, level + 1)
+        stack.extend((child, level + 1) for child in reversed(children))
+    return lines
 
 
 def _render_find_results(result: dict[str, Any]) -> None:
@@ -193,22 +253,34 @@ def _render_find_results(result: dict[str, Any]) -> None:
         return
 
     st.markdown(f"**Found {len(results)} documents**")
+    st.markdown(
+        "\n".join(
+            f"- **{doc.get('name', 'Unknown')}** (`{doc.get('path', '')}`) - "
+            f"score: {doc.get('score', 0):.2f}"
+            for doc in results
+        )
+    )
+
 
-    for doc in results:
-        name = doc.get("name", "Unknown")
-        path = doc.get("path", "")
-        score = doc.get("score", 0)
+# (required keys, renderer) in priority order; the first match wins
+_RENDERERS: tuple[tuple[frozenset[str], Callable[[dict[str, Any]], None]], ...] = (
+    (frozenset({"matches"}), _render_search_results),
+    (frozenset({"collections"}), _render_browse_results),
+    (frozenset({"documents"}), _render_browse_results),
+    (frozenset({"content"}), _render_document_content),
+    (frozenset({"name", "path"}), _render_document_info),
+    (frozenset({"results"}), _render_find_results),
+)
 
-        st.markdown(f"- **{name}** (`{path}`) - score: {score:.2f}")
+
+# (unit, divisor) indexed by floor(log1024(size))
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024**2), ("GB", 1024**3))
 
 
 def _format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    idx = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    unit, divisor = _SIZE_UNITS[idx]
+    return f"{size_bytes / divisor:.1f} {unit}"
@@ -3,14 +3,29 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import streamlit as st
 
-# Add inspector directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from mcp_client import MCPClientError, ServerConfig, list_tools
+# Add inspector directory to path for imports (once per process)
+_INSPECTOR_DIR = str(Path(__file__).parent.parent)
+if _INSPECTOR_DIR not in sys.path:
+    sys.path.insert(0, _INSPECTOR_DIR)
+
+from client_cache import clear_client_cache  # noqa: E402
+from mcp_client import (  # noqa: E402
+    MCPClientError,
+    MCPSession,
+    PromptInfo,
+    ResourceInfo,
+    ServerConfig,
+    ToolInfo,
+    close_session,
+    get_log_collector,
+    open_session,
+)
 
 
 def render_sidebar() -> None:
@@ -28,6 +43,14 @@ def render_sidebar() -> None:
         key="root_path_input",
     )
 
+    debug_logs = st.sidebar.checkbox(
+        "Capture debug logs",
+        value=False,
+        help="Record client DEBUG messages (tool arguments, response previews)",
+        key="debug_logs",
+    )
+    get_log_collector().set_debug_enabled(debug_logs)
+
     # Connect button
     col1, col2 = st.sidebar.columns(2)
 
@@ -39,6 +62,10 @@ def render_sidebar() -> None:
         if st.button("Disconnect", use_container_width=True):
             _disconnect()
 
+    if "_connect_future" in st.session_state:
+        with st.sidebar:
+            _poll_connection()
+
     st.sidebar.markdown("---")
 
     # Connection status
@@ -50,29 +77,86 @@ def render_sidebar() -> None:
         _render_tool_list()
 
 
+def _get_pool() -> ThreadPoolExecutor:
+    """Get this browser session's worker pool for MCP requests."""
+    pool = st.session_state.get("_mcp_pool")
+    if pool is None:
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mcp-fetch")
+        st.session_state["_mcp_pool"] = pool
+    return pool
+
+
 def _connect_to_server(root_path: str) -> None:
-    """Attempt to connect to the MCP server."""
+    """Start connecting to the MCP server in the background.
+
+    The server start and metadata fetch run on a worker thread so the page
+    keeps rendering; _poll_connection picks up the result.
+    """
     config = ServerConfig(root_path=root_path)
     st.session_state["server_config"] = config
     st.session_state["root_path"] = root_path
-
-    with st.spinner("Connecting to MCP server..."):
-        try:
-            tools = list_tools(config)
-            st.session_state["tools"] = tools
-            st.session_state["connected"] = True
-            st.session_state["error"] = None
-            st.toast(f"Connected! {len(tools)} tools available", icon="✅")
-        except MCPClientError as e:
-            st.session_state["connected"] = False
-            st.session_state["error"] = str(e)
-            st.toast(f"Connection failed: {e}", icon="❌")
+    st.session_state["_connect_future"] = _get_pool().submit(_open_and_prefetch, config)
+
+
+def _open_and_prefetch(
+    config: ServerConfig,
+) -> tuple[MCPSession, tuple[list[ToolInfo], list[ResourceInfo], list[PromptInfo]]]:
+    """Open the server session and fill the Tools, Resources and Prompts tabs in one round trip."""
+    session = open_session(config)
+    return session, session.prefetch_all()
+
+
+def _close_dropped_connect(future: Future[tuple[MCPSession, Any]]) -> None:
+    """Close the session a connect opened after the user disconnected."""
+    if not future.cancelled() and future.exception() is None:
+        session, _ = future.result()
+        close_session(session.config, session)
+
+
+@st.fragment(run_every=0.25)
+def _poll_connection() -> None:
+    """Wait for a pending connect without blocking the rest of the page."""
+    future: Future[Any] | None = st.session_state.get("_connect_future")
+    if future is None:
+        return
+    if not future.done():
+        st.caption("Connecting to MCP server...")
+        return
+
+    del st.session_state["_connect_future"]
+    try:
+        _, (tools, resources, prompts) = future.result()
+        st.session_state["tools"] = tools
+        st.session_state["tools_by_name"] = {t.name: t for t in tools}
+        st.session_state["resources"] = resources
+        st.session_state["prompts"] = prompts
+        st.session_state["connected"] = True
+        st.session_state["error"] = None
+        st.toast(f"Connected! {len(tools)} tools available", icon="✅")
+    except MCPClientError as e:
+        st.session_state["connected"] = False
+        st.session_state["error"] = str(e)
+        st.toast(f"Connection failed: {e}", icon="❌")
+
+    # Rerun the whole app so the tabs pick up the new state
+    st.rerun()
 
 
 def _disconnect() -> None:
     """Disconnect from the server."""
+    # A pending connect can't be interrupted; close its session once it is open
+    future: Future[Any] | None = st.session_state.pop("_connect_future", None)
+    if future is not None:
+        future.add_done_callback(_close_dropped_connect)
+
+    config = st.session_state.get("server_config")
+    if config is not None:
+        clear_client_cache(config)
     st.session_state["connected"] = False
     st.session_state["tools"] = []
+    st.session_state["tools_by_name"] = {}
+    st.session_state["resources"] = []
+    st.session_state["prompts"] = []
     st.session_state["server_config"] = None
     st.session_state["error"] = None
     st.toast("Disconnected", icon="👋")
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
-# Add inspector directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add inspector directory to path for imports (once per process)
+_INSPECTOR_DIR = str(Path(__file__).parent.parent)
+if _INSPECTOR_DIR not in sys.path:
+    sys.path.insert(0, _INSPECTOR_DIR)
 
-from components.results import render_result
-from mcp_client import MCPClientError, ToolInfo, call_tool
+from components.results import render_result  # noqa: E402
+from mcp_client import MCPClientError, ToolInfo, call_tool, json_loads  # noqa: E402
 
 
 def render_tool_section() -> None:
@@ -21,16 +28,16 @@ def render_tool_section() -> None:
         st.info("Please connect to an MCP server first using the sidebar.")
         return
 
-    tools: list[ToolInfo] = st.session_state.get("tools", [])
-    if not tools:
+    # Name -> tool map built once on connect (insertion order = server order)
+    tools_by_name: dict[str, ToolInfo] = st.session_state.get("tools_by_name", {})
+    if not tools_by_name:
         st.warning("No tools available from the server.")
         return
 
     # Tool selector
-    tool_names = [t.name for t in tools]
     selected_name = st.selectbox(
         "Select Tool",
-        options=tool_names,
+        options=tools_by_name,
         key="selected_tool",
     )
 
@@ -38,7 +45,7 @@ def render_tool_section() -> None:
         return
 
     # Find selected tool
-    tool = next((t for t in tools if t.name == selected_name), None)
+    tool = tools_by_name.get(selected_name)
     if not tool:
         return
 
@@ -66,63 +73,147 @@ def _render_tool_form(tool: ToolInfo) -> None:
         submitted = st.form_submit_button("Execute", use_container_width=True)
 
         if submitted:
-            _execute_tool(tool.name, args)
+            _execute_tool(tool, args)
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Pre-computed layout of a single form field.
+
+    Attributes:
+        name: Argument name
+        kind: Widget kind (scope, pages, terms, enum, string, integer,
+            boolean, array, object or text)
+        label: Widget label (name plus "*" when required)
+        key: Streamlit widget key
+        help: Field description from the schema
+        required: Whether the argument is required
+        default: Schema default value
+        enum: Allowed values for enum fields
+        item_type: Item type for array fields
+    """
+
+    name: str
+    kind: str
+    label: str
+    key: str
+    help: str
+    required: bool = False
+    default: Any = None
+    enum: tuple[Any, ...] = ()
+    item_type: str = "string"
+
+
+# Argument names with a dedicated widget, keyed by (name, schema type)
+_SPECIAL_FIELDS = {
+    ("scope", "object"): "scope",
+    ("pages", "array"): "pages",
+    ("terms", "array"): "terms",
+}
+
+_STANDARD_KINDS = frozenset({"string", "integer", "boolean", "array", "object"})
+
+
+@st.cache_data(show_spinner=False, hash_funcs={dict: lambda d: json.dumps(d, sort_keys=True)})
+def plan_fields(schema: dict[str, Any], tool_name: str) -> list[FieldSpec]:
+    """Translate a tool's input schema into form field specs.
+
+    The schema never changes for a tool, so the walk is cached and reruns
+    only replay the resulting specs.
+
+    Args:
+        schema: Tool input JSON schema
+        tool_name: Tool name, used to namespace widget keys
+
+    Returns:
+        One FieldSpec per schema property, in schema order
+    """
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    specs = []
+
+    for prop_name, prop_schema in properties.items():
+        is_required = prop_name in required
+        field_type = prop_schema.get("type", "string")
+
+        kind = _SPECIAL_FIELDS.get((prop_name, field_type))
+        if kind is None:
+            if field_type == "string" and "enum" in prop_schema:
+                kind = "enum"
+            elif field_type in _STANDARD_KINDS:
+                kind = field_type
+            else:
+                kind = "text"
+
+        specs.append(
+            FieldSpec(
+                name=prop_name,
+                kind=kind,
+                label=f"{prop_name}{'*' if is_required else ''}",
+                key=f"{tool_name}_{prop_name}",
+                help=prop_schema.get("description", ""),
+                required=is_required,
+                default=prop_schema.get("default"),
+                enum=tuple(prop_schema.get("enum", ())),
+                item_type=prop_schema.get("items", {}).get("type", "string"),
+            )
+        )
+
+    return specs
 
 
 def _build_form_fields(schema: dict[str, Any], tool_name: str) -> dict[str, Any]:
     """Build form fields from JSON schema and return collected values."""
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
     args: dict[str, Any] = {}
 
-    for prop_name, prop_schema in properties.items():
-        is_required = prop_name in required
-        value = _render_field(prop_name, prop_schema, is_required, tool_name)
+    for spec in plan_fields(schema, tool_name):
+        value = _render_field(spec)
 
         # Only include non-empty values
         if value is not None and value != "" and value != []:
-            args[prop_name] = value
+            args[spec.name] = value
 
     return args
 
 
-def _render_field(name: str, schema: dict[str, Any], required: bool, parent_key: str) -> Any:
-    """Render a single form field based on its schema."""
-    field_type = schema.get("type", "string")
-    description = schema.get("description", "")
-    default = schema.get("default")
-    label = f"{name}{'*' if required else ''}"
-    key = f"{parent_key}_{name}"
+def _render_field(spec: FieldSpec) -> Any:
+    """Render a single form field from its spec."""
+    kind, label, key, description = spec.kind, spec.label, spec.key, spec.help
 
     # Handle special cases first
-    if name == "scope" and field_type == "object":
+    if kind == "scope":
         return _render_scope_field(key)
 
-    if name == "pages" and field_type == "array":
+    if kind == "pages":
         return _render_pages_field(key, description)
 
-    if name == "terms" and field_type == "array":
+    if kind == "terms":
         return _render_terms_field(key, description)
 
     # Standard field types
-    if field_type == "string":
-        if "enum" in schema:
-            return st.selectbox(label, options=schema["enum"], help=description, key=key)
-        return st.text_input(label, value=default or "", help=description, key=key)
+    if kind == "enum":
+        return st.selectbox(label, options=spec.enum, help=description, key=key)
 
-    if field_type == "integer":
+    if kind == "string":
+        return st.text_input(label, value=spec.default or "", help=description, key=key)
+
+    if kind == "integer":
         return st.number_input(
-            label, value=default if default is not None else 0, step=1, help=description, key=key
+            label,
+            value=spec.default if spec.default is not None else 0,
+            step=1,
+            help=description,
+            key=key,
         )
 
-    if field_type == "boolean":
-        return st.checkbox(label, value=default or False, help=description, key=key)
+    if kind == "boolean":
+        return st.checkbox(label, value=spec.default or False, help=description, key=key)
 
-    if field_type == "array":
-        return _render_generic_array_field(name, schema, label, description, key)
+    if kind == "array":
+        return _render_generic_array_field(spec)
 
-    if field_type == "object":
-        return _render_generic_object_field(name, schema, label, description, key)
+    if kind == "object":
+        return _render_generic_object_field(spec)
 
     # Fallback to text input
     return st.text_input(label, help=description, key=key)
@@ -175,11 +266,15 @@ def _render_pages_field(key: str, description: str) -> list[int]:
         return []
 
 
+# search_multiple accepts at most this many terms
+_MAX_TERMS = 10
+
+
 def _render_terms_field(key: str, description: str) -> list[str]:
     """Render the terms field for search_multiple."""
     text = st.text_area(
         "terms*",
-        help=f"{description} (one term per line, max 10)",
+        help=f"{description} (one term per line, max {_MAX_TERMS})",
         key=key,
         height=100,
     )
@@ -187,73 +282,109 @@ def _render_terms_field(key: str, description: str) -> list[str]:
     if not text:
         return []
 
-    terms = [line.strip() for line in text.split("\n") if line.strip()]
-    if len(terms) > 10:
-        st.warning("Maximum 10 terms allowed. Only first 10 will be used.")
-        return terms[:10]
+    # Stop after one term past the limit; a pasted document isn't scanned whole
+    terms: list[str] = []
+    for line in text.splitlines():
+        term = line.strip()
+        if term:
+            terms.append(term)
+            if len(terms) > _MAX_TERMS:
+                break
+
+    if len(terms) > _MAX_TERMS:
+        st.warning(f"Maximum {_MAX_TERMS} terms allowed. Only first {_MAX_TERMS} will be used.")
+        return terms[:_MAX_TERMS]
 
     return terms
 
 
-def _render_generic_array_field(
-    name: str, schema: dict[str, Any], label: str, description: str, key: str
-) -> list[Any]:
+def _render_generic_array_field(spec: FieldSpec) -> list[Any]:
     """Render a generic array field."""
     text = st.text_input(
-        label,
-        help=f"{description} (comma-separated)",
-        key=key,
+        spec.label,
+        help=f"{spec.help} (comma-separated)",
+        key=spec.key,
     )
 
     if not text:
         return []
 
-    item_type = schema.get("items", {}).get("type", "string")
     items = [x.strip() for x in text.split(",") if x.strip()]
 
-    if item_type == "integer":
+    if spec.item_type == "integer":
         try:
             return [int(x) for x in items]
         except ValueError:
-            st.warning(f"Invalid values for {name}. Expected integers.")
+            st.warning(f"Invalid values for {spec.name}. Expected integers.")
             return []
 
     return items
 
 
-def _render_generic_object_field(
-    name: str, schema: dict[str, Any], label: str, description: str, key: str
-) -> dict[str, Any]:
+def _render_generic_object_field(spec: FieldSpec) -> dict[str, Any]:
     """Render a generic object field as JSON input."""
-    st.markdown(f"**{label}**")
-    st.caption(description)
+    name = spec.name
+    st.markdown(f"**{spec.label}**")
+    st.caption(spec.help)
 
     json_text = st.text_area(
         f"{name} (JSON)",
         help="Enter JSON object",
-        key=key,
+        key=spec.key,
         height=100,
     )
 
     if not json_text:
         return {}
 
-    import json
-
     try:
-        return json.loads(json_text)
+        return json_loads(json_text)
     except json.JSONDecodeError:
         st.warning(f"Invalid JSON for {name}")
         return {}
 
 
-def _execute_tool(tool_name: str, args: dict[str, Any]) -> None:
+@functools.lru_cache(maxsize=128)
+def _get_validator(schema_json: str) -> Validator:
+    """Build a JSON Schema validator once per distinct tool schema.
+
+    Args:
+        schema_json: Tool input schema serialized with sorted keys
+
+    Returns:
+        Validator instance for the schema's declared draft
+    """
+    schema = json.loads(schema_json)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _validate_args(schema: dict[str, Any], args: dict[str, Any]) -> list[str]:
+    """Validate tool arguments against the tool's input schema.
+
+    Returns:
+        Error messages (empty if the arguments are valid)
+    """
+    validator = _get_validator(json.dumps(schema, sort_keys=True))
+    return [error.message for error in validator.iter_errors(args)]
+
+
+def _execute_tool(tool: ToolInfo, args: dict[str, Any]) -> None:
     """Execute a tool and store the result."""
     config = st.session_state.get("server_config")
     if not config:
         st.error("No server configuration found.")
         return
 
+    # Catch invalid input locally instead of paying a server round trip
+    errors = _validate_args(tool.schema, args)
+    if errors:
+        st.error("Invalid arguments:\n" + "\n".join(f"- {e}" for e in errors))
+        return
+
+    tool_name = tool.name
+
     with st.spinner(f"Executing {tool_name}..."):
         try:
             result = call_tool(config, tool_name, args)
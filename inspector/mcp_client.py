@@ -3,46 +3,89 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import codecs
+import concurrent.futures
+import functools
 import json
 import logging
+import os
+import re
 import threading
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
-import nest_asyncio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-# Enable nested event loops for Streamlit compatibility
-nest_asyncio.apply()
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
 
 # Setup logging
 logger = logging.getLogger("mcp_inspector")
 
 
+def json_loads(text: str) -> Any:
+    """Parse JSON, using orjson when installed.
+
+    Raises:
+        json.JSONDecodeError: On invalid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to JSON text (non-ASCII kept as-is), using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
 @dataclass
 class LogEntry:
-    """A single log entry."""
+    """A single log entry.
+
+    Entries are never modified after creation, so the display string is
+    built once here instead of on every Streamlit rerun.
+    """
 
     timestamp: datetime
     level: str
     source: str  # "client" or "server"
     message: str
+    _formatted: str = field(init=False, repr=False, compare=False)
 
-    def format(self) -> str:
+    def __post_init__(self) -> None:
         ts = self.timestamp.strftime("%H:%M:%S.%f")[:-3]
-        return f"[{ts}] [{self.level}] [{self.source}] {self.message}"
+        self._formatted = f"[{ts}] [{self.level}] [{self.source}] {self.message}"
+
+    def format(self) -> str:
+        return self._formatted
 
 
 class LogCollector:
-    """Collects logs from client and server."""
+    """Collects logs from client and server.
+
+    Besides the main log, entries are indexed by level and by source so the
+    UI filters are a dict lookup instead of a scan over every entry.
+    """
 
     def __init__(self, max_entries: int = 500):
-        self.entries: list[LogEntry] = []
+        self.entries: deque[LogEntry] = deque(maxlen=max_entries)
         self.max_entries = max_entries
+        self._by_level: dict[str, deque[LogEntry]] = defaultdict(deque)
+        self._by_source: dict[str, deque[LogEntry]] = defaultdict(deque)
         self._lock = threading.Lock()
+        self._debug_enabled = False
 
     def add(self, level: str, source: str, message: str) -> None:
         entry = LogEntry(
@@ -52,31 +95,112 @@ class LogCollector:
             message=message,
         )
         with self._lock:
-            self.entries.append(entry)
-            if len(self.entries) > self.max_entries:
-                self.entries = self.entries[-self.max_entries :]
+            self._append(entry)
+
+    def add_many(self, entries: Iterable[LogEntry]) -> None:
+        """Add pre-built entries under a single lock acquisition."""
+        with self._lock:
+            for entry in entries:
+                self._append(entry)
+
+    def _append(self, entry: LogEntry) -> None:
+        """Append an entry and keep the indexes in sync (caller holds the lock)."""
+        if len(self.entries) == self.max_entries:
+            # The deque drops its oldest entry on append, which is also
+            # the oldest in its buckets
+            evicted = self.entries[0]
+            self._by_level[evicted.level].popleft()
+            self._by_source[evicted.source].popleft()
+        self.entries.append(entry)
+        self._by_level[entry.level].append(entry)
+        self._by_source[entry.source].append(entry)
+
+    def is_debug_enabled(self) -> bool:
+        """Whether client DEBUG messages are recorded.
+
+        Callers check this before building expensive DEBUG messages.
+        """
+        return self._debug_enabled
+
+    def set_debug_enabled(self, enabled: bool) -> None:
+        self._debug_enabled = enabled
 
     def client_log(self, level: str, message: str) -> None:
+        if level == "DEBUG" and not self._debug_enabled:
+            return
         self.add(level, "client", message)
 
     def server_log(self, message: str) -> None:
-        # Parse log level from message if present
-        level = "INFO"
-        if "ERROR" in message or "error" in message.lower():
-            level = "ERROR"
-        elif "WARNING" in message or "warning" in message.lower():
-            level = "WARN"
-        elif "DEBUG" in message or "debug" in message.lower():
-            level = "DEBUG"
-        self.add(level, "server", message.strip())
+        self.add_many([_server_entry(message)])
 
     def get_all(self) -> list[LogEntry]:
         with self._lock:
             return list(self.entries)
 
+    def get_tail(self, n: int) -> list[LogEntry]:
+        """Get the newest n entries (oldest first) without copying the whole log."""
+        return self.get_filtered(None, None, limit=n)
+
+    def get_filtered(
+        self, level: str | None, source: str | None, limit: int | None = None
+    ) -> list[LogEntry]:
+        """Get entries matching level and/or source (None matches any).
+
+        Args:
+            level: Log level to match, or None for any
+            source: Log source to match, or None for any
+            limit: Return only the newest `limit` matches
+
+        Returns:
+            Matching entries, oldest first
+        """
+        with self._lock:
+            if level is None and source is None:
+                matches: Iterable[LogEntry] = reversed(self.entries)
+            elif source is None:
+                matches = reversed(self._by_level.get(level, ()))
+            elif level is None:
+                matches = reversed(self._by_source.get(source, ()))
+            else:
+                # Both filters: scan the smaller bucket
+                by_level = self._by_level.get(level, ())
+                by_source = self._by_source.get(source, ())
+                if len(by_level) <= len(by_source):
+                    matches = (e for e in reversed(by_level) if e.source == source)
+                else:
+                    matches = (e for e in reversed(by_source) if e.level == level)
+            newest_first = list(islice(matches, limit))
+        newest_first.reverse()
+        return newest_first
+
+    def count(self, level: str | None = None, source: str | None = None) -> int:
+        """Count entries matching level and/or source without building a list."""
+        with self._lock:
+            if level is None and source is None:
+                return len(self.entries)
+            if source is None:
+                return len(self._by_level.get(level, ()))
+            if level is None:
+                return len(self._by_source.get(source, ()))
+            return sum(1 for e in self._by_level.get(level, ()) if e.source == source)
+
     def clear(self) -> None:
         with self._lock:
             self.entries.clear()
+            self._by_level.clear()
+            self._by_source.clear()
+
+
+# First level word in a server log line (e.g. "... - WARNING - ...")
+_LEVEL_RE = re.compile(r"\b(ERROR|WARN(?:ING)?|DEBUG)\b", re.IGNORECASE)
+_LEVEL_NAMES = {"ERROR": "ERROR", "WARN": "WARN", "WARNING": "WARN", "DEBUG": "DEBUG"}
+
+
+def _server_entry(message: str) -> LogEntry:
+    """Build a server log entry, parsing its level from the message if present."""
+    match = _LEVEL_RE.search(message)
+    level = _LEVEL_NAMES[match.group(1).upper()] if match else "INFO"
+    return LogEntry(timestamp=datetime.now(), level=level, source="server", message=message.strip())
 
 
 # Global log collector
@@ -88,24 +212,32 @@ def get_log_collector() -> LogCollector:
     return _log_collector
 
 
-@dataclass
+# The fathom-mcp project directory, used as the server's working directory
+_PROJECT_DIR = str(Path(__file__).parent.parent)
+
+
+@dataclass(frozen=True)
 class ServerConfig:
-    """Configuration for connecting to fathom-mcp MCP server."""
+    """Configuration for connecting to fathom-mcp MCP server.
+
+    Immutable and hashable, so derived values are computed once per
+    instance and a config can key the session registry directly.
+    """
 
     root_path: str
     command: str = "uv"
-    working_dir: str = ""
+    working_dir: str = _PROJECT_DIR
 
     def __post_init__(self) -> None:
         if not self.working_dir:
-            # Use the fathom-mcp project directory
-            self.working_dir = str(Path(__file__).parent.parent)
+            object.__setattr__(self, "working_dir", _PROJECT_DIR)
 
-    @property
+    @functools.cached_property
     def args(self) -> list[str]:
         return ["run", "fathom-mcp", "--root", self.root_path]
 
-    def to_params(self) -> StdioServerParameters:
+    @functools.cached_property
+    def params(self) -> StdioServerParameters:
         return StdioServerParameters(
             command=self.command,
             args=self.args,
@@ -147,222 +279,420 @@ class MCPClientError(Exception):
     pass
 
 
-# NOTE: Server stderr logging through custom TextIO doesn't work with stdio_client
-# because it requires a real file descriptor for subprocess communication.
-# Server logs will go to the terminal's stderr instead of being captured in the UI.
-# Client-side logs (connection, tool calls) are still captured through LogCollector.
+class LogCapturingTextIO:
+    """Line-buffered sink that turns written text into server log entries."""
+
+    def __init__(self, collector: LogCollector):
+        self.collector = collector
+        self._buffer = ""
+
+    def write(self, s: str) -> int:
+        self._buffer += s
+        if "\n" not in s:
+            return len(s)
+
+        # One split per write; the trailing partial line stays buffered.
+        # Entries are built before taking the collector's lock once.
+        parts = self._buffer.split("\n")
+        self._buffer = parts[-1]
+        self.collector.add_many([_server_entry(line) for line in parts[:-1] if line.strip()])
+        return len(s)
+
+    def flush(self) -> None:
+        if self._buffer.strip():
+            self.collector.server_log(self._buffer)
+        self._buffer = ""
+
+
+def _capture_stderr(collector: LogCollector) -> TextIO:
+    """Create a pipe whose contents are forwarded to the log collector.
+
+    stdio_client hands errlog to the subprocess as its stderr, so it must be
+    a real file descriptor rather than a custom TextIO. The server writes into
+    the pipe and a daemon thread feeds the read end to LogCapturingTextIO
+    until the server exits and the returned write end is closed.
 
+    Returns:
+        Write end of the pipe, to pass as stdio_client's errlog
+    """
+    read_fd, write_fd = os.pipe()
+    sink = LogCapturingTextIO(collector)
 
-async def _list_tools(config: ServerConfig) -> list[ToolInfo]:
-    """Fetch all tools from MCP server."""
+    def pump() -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+            while chunk := pipe.read(65536):
+                sink.write(decoder.decode(chunk))
+        sink.write(decoder.decode(b"", final=True))
+        sink.flush()
+
+    threading.Thread(target=pump, name="mcp-server-stderr", daemon=True).start()
+    return os.fdopen(write_fd, "w")
+
+
+async def _fetch_tools(session: ClientSession) -> list[ToolInfo]:
+    """List tools on an initialized session."""
     collector = get_log_collector()
-    collector.client_log("INFO", f"Connecting to server: {config.command} {' '.join(config.args)}")
-
-    async with stdio_client(config.to_params()) as streams:
-        read_stream, write_stream = streams
-        collector.client_log("DEBUG", "Connection established, initializing session...")
-
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            collector.client_log("DEBUG", "Session initialized, listing tools...")
-
-            result = await session.list_tools()
-            tools = [
-                ToolInfo(
-                    name=t.name,
-                    description=t.description or "",
-                    schema=t.inputSchema if hasattr(t, "inputSchema") else {},
-                )
-                for t in result.tools
-            ]
-            collector.client_log("INFO", f"Found {len(tools)} tools: {[t.name for t in tools]}")
-            return tools
-
-
-async def _call_tool(config: ServerConfig, name: str, args: dict[str, Any]) -> dict[str, Any]:
-    """Call a tool and return the result."""
+    collector.client_log("DEBUG", "Listing tools...")
+
+    result = await session.list_tools()
+    tools = [
+        ToolInfo(
+            name=t.name,
+            description=t.description or "",
+            schema=t.inputSchema if hasattr(t, "inputSchema") else {},
+        )
+        for t in result.tools
+    ]
+    collector.client_log("INFO", f"Found {len(tools)} tools: {[t.name for t in tools]}")
+    return tools
+
+
+async def _fetch_tool_result(
+    session: ClientSession, name: str, args: dict[str, Any]
+) -> dict[str, Any]:
+    """Call a tool on an initialized session and parse its result."""
     collector = get_log_collector()
     collector.client_log("INFO", f"Calling tool: {name}")
-    collector.client_log("DEBUG", f"Arguments: {json.dumps(args, ensure_ascii=False)}")
-
-    async with stdio_client(config.to_params()) as streams:
-        read_stream, write_stream = streams
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            result = await session.call_tool(name, arguments=args)
-
-            # Parse TextContent result
-            if result.content and len(result.content) > 0:
-                content = result.content[0]
-                if hasattr(content, "text"):
-                    try:
-                        parsed = json.loads(content.text)
-                        collector.client_log("INFO", f"Tool {name} returned successfully")
-                        collector.client_log(
-                            "DEBUG",
-                            f"Response preview: {content.text[:200]}..."
-                            if len(content.text) > 200
-                            else f"Response: {content.text}",
-                        )
-                        return parsed
-                    except json.JSONDecodeError:
-                        collector.client_log("WARN", "Response is not valid JSON")
-                        return {"raw": content.text}
-
-            collector.client_log("WARN", f"Empty or unexpected response from {name}")
-            return {"raw": str(result)}
-
-
-async def _list_resources(config: ServerConfig) -> list[ResourceInfo]:
-    """Fetch all resources from MCP server."""
+    if collector.is_debug_enabled():
+        collector.client_log("DEBUG", f"Arguments: {json_dumps(args)}")
+
+    result = await session.call_tool(name, arguments=args)
+
+    # Parse TextContent result
+    if result.content and len(result.content) > 0:
+        content = result.content[0]
+        if hasattr(content, "text"):
+            try:
+                parsed = json_loads(content.text)
+                collector.client_log("INFO", f"Tool {name} returned successfully")
+                if collector.is_debug_enabled():
+                    collector.client_log(
+                        "DEBUG",
+                        f"Response preview: {content.text[:200]}..."
+                        if len(content.text) > 200
+                        else f"Response: {content.text}",
+                    )
+                return parsed
+            except json.JSONDecodeError:
+                collector.client_log("WARN", "Response is not valid JSON")
+                return {"raw": content.text}
+
+    collector.client_log("WARN", f"Empty or unexpected response from {name}")
+    return {"raw": str(result)}
+
+
+async def _fetch_resources(session: ClientSession) -> list[ResourceInfo]:
+    """List resources on an initialized session."""
     collector = get_log_collector()
     collector.client_log("INFO", "Listing resources...")
 
-    async with stdio_client(config.to_params()) as streams:
-        read_stream, write_stream = streams
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            result = await session.list_resources()
-            resources = [
-                ResourceInfo(
-                    uri=str(r.uri),
-                    name=r.name,
-                    description=r.description if hasattr(r, "description") else None,
-                    mime_type=r.mimeType if hasattr(r, "mimeType") else None,
-                )
-                for r in result.resources
-            ]
-            collector.client_log("INFO", f"Found {len(resources)} resources")
-            return resources
-
-
-async def _read_resource(config: ServerConfig, uri: str) -> str:
-    """Read a resource content."""
+    result = await session.list_resources()
+    resources = [
+        ResourceInfo(
+            uri=str(r.uri),
+            name=r.name,
+            description=r.description if hasattr(r, "description") else None,
+            mime_type=r.mimeType if hasattr(r, "mimeType") else None,
+        )
+        for r in result.resources
+    ]
+    collector.client_log("INFO", f"Found {len(resources)} resources")
+    return resources
+
+
+async def _fetch_resource_text(session: ClientSession, uri: str) -> str:
+    """Read a resource on an initialized session."""
     collector = get_log_collector()
     collector.client_log("INFO", f"Reading resource: {uri}")
 
-    async with stdio_client(config.to_params()) as streams:
-        read_stream, write_stream = streams
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            result = await session.read_resource(uri)
+    result = await session.read_resource(uri)  # type: ignore[arg-type]
 
-            if result.contents and len(result.contents) > 0:
-                content = result.contents[0]
-                if hasattr(content, "text"):
-                    collector.client_log("INFO", f"Resource read: {len(content.text)} chars")
-                    return content.text
+    if result.contents and len(result.contents) > 0:
+        content = result.contents[0]
+        if hasattr(content, "text"):
+            collector.client_log("INFO", f"Resource read: {len(content.text)} chars")
+            return content.text
 
-            collector.client_log("WARN", "Empty resource content")
-            return str(result)
+    collector.client_log("WARN", "Empty resource content")
+    return str(result)
 
 
-async def _list_prompts(config: ServerConfig) -> list[PromptInfo]:
-    """Fetch all prompts from MCP server."""
+async def _fetch_prompts(session: ClientSession) -> list[PromptInfo]:
+    """List prompts on an initialized session."""
     collector = get_log_collector()
     collector.client_log("INFO", "Listing prompts...")
 
-    async with stdio_client(config.to_params()) as streams:
-        read_stream, write_stream = streams
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            result = await session.list_prompts()
-            prompts = [
-                PromptInfo(
-                    name=p.name,
-                    description=p.description if hasattr(p, "description") else None,
-                    arguments=list(p.arguments) if hasattr(p, "arguments") and p.arguments else [],
-                )
-                for p in result.prompts
-            ]
-            collector.client_log("INFO", f"Found {len(prompts)} prompts")
-            return prompts
-
-
-async def _get_prompt(
-    config: ServerConfig, name: str, args: dict[str, str]
+    result = await session.list_prompts()
+    prompts = [
+        PromptInfo(
+            name=p.name,
+            description=p.description if hasattr(p, "description") else None,
+            arguments=list(p.arguments) if hasattr(p, "arguments") and p.arguments else [],
+        )
+        for p in result.prompts
+    ]
+    collector.client_log("INFO", f"Found {len(prompts)} prompts")
+    return prompts
+
+
+async def _fetch_prompt_messages(
+    session: ClientSession, name: str, args: dict[str, str]
 ) -> list[dict[str, Any]]:
-    """Get a prompt with arguments."""
+    """Get a prompt with arguments on an initialized session."""
     collector = get_log_collector()
     collector.client_log("INFO", f"Getting prompt: {name}")
 
-    async with stdio_client(config.to_params()) as streams:
-        read_stream, write_stream = streams
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            result = await session.get_prompt(name, arguments=args)
+    result = await session.get_prompt(name, arguments=args)
+
+    messages = []
+    for msg in result.messages:
+        content_text = ""
+        if hasattr(msg.content, "text"):
+            content_text = msg.content.text
+        elif isinstance(msg.content, str):
+            content_text = msg.content
+        messages.append({"role": msg.role, "content": content_text})
+
+    collector.client_log("INFO", f"Prompt returned {len(messages)} messages")
+    return messages
+
+
+async def _fetch_all(
+    session: ClientSession,
+) -> tuple[list[ToolInfo], list[ResourceInfo], list[PromptInfo]]:
+    """List tools, resources and prompts concurrently on one session."""
+    return await asyncio.gather(
+        _fetch_tools(session), _fetch_resources(session), _fetch_prompts(session)
+    )
+
+
+class MCPSession:
+    """Persistent connection to an MCP server.
+
+    The server subprocess and its initialized ClientSession stay open on a
+    background event loop (see _SessionManager), so each request is a single JSON-RPC round
+    trip instead of a process spawn plus handshake. Methods are synchronous
+    and safe to call from any thread.
+    """
+
+    def __init__(self, config: ServerConfig, loop: asyncio.AbstractEventLoop):
+        self.config = config
+        self._loop = loop
+        self._session: ClientSession | None = None
+        self._stop: asyncio.Event | None = None
+        self._runner: concurrent.futures.Future[None] | None = None
+
+    @classmethod
+    def connect(cls, config: ServerConfig, loop: asyncio.AbstractEventLoop) -> MCPSession:
+        """Start the server and initialize a session.
+
+        Args:
+            config: Server to start
+            loop: Running event loop (on another thread) that owns the session
+
+        Raises:
+            MCPClientError: If the server cannot be started or initialized
+        """
+        collector = get_log_collector()
+        collector.client_log(
+            "INFO", f"Connecting to server: {config.command} {' '.join(config.args)}"
+        )
 
-            messages = []
-            for msg in result.messages:
-                content_text = ""
-                if hasattr(msg.content, "text"):
-                    content_text = msg.content.text
-                elif isinstance(msg.content, str):
-                    content_text = msg.content
-                messages.append({"role": msg.role, "content": content_text})
+        mcp_session = cls(config, loop)
+        ready: concurrent.futures.Future[None] = concurrent.futures.Future()
+        mcp_session._runner = asyncio.run_coroutine_threadsafe(mcp_session._hold_open(ready), loop)
+        try:
+            ready.result()
+        except Exception as e:
+            collector.client_log("ERROR", f"Failed to connect: {e}")
+            raise MCPClientError(f"Failed to connect: {e}") from e
+        return mcp_session
+
+    async def _hold_open(self, ready: concurrent.futures.Future[None]) -> None:
+        """Keep the connection open until close() is called."""
+        self._stop = asyncio.Event()
+        errlog = _capture_stderr(get_log_collector())
+        try:
+            async with stdio_client(self.config.params, errlog=errlog) as streams:
+                read_stream, write_stream = streams
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    get_log_collector().client_log("DEBUG", "Persistent session initialized")
+                    self._session = session
+                    ready.set_result(None)
+                    await self._stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                raise
+        finally:
+            self._session = None
+            errlog.close()
 
-            collector.client_log("INFO", f"Prompt returned {len(messages)} messages")
-            return messages
+    @property
+    def is_open(self) -> bool:
+        """Whether the session is connected and accepting requests."""
+        return self._session is not None
+
+    def _submit[T](self, op: Callable[[ClientSession], Awaitable[T]], action: str) -> T:
+        """Run ``op`` on the session's loop and wait for its result."""
+        try:
+            session = self._session
+            if session is None:
+                raise RuntimeError("session is closed")
+            return asyncio.run_coroutine_threadsafe(op(session), self._loop).result()
+        except Exception as e:
+            get_log_collector().client_log("ERROR", f"Failed to {action}: {e}")
+            raise MCPClientError(f"Failed to {action}: {e}") from e
+
+    def list_tools(self) -> list[ToolInfo]:
+        """Get list of available tools."""
+        return self._submit(_fetch_tools, "list tools")
+
+    def call_tool(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
+        """Call a tool."""
+        return self._submit(lambda s: _fetch_tool_result(s, name, args), f"call tool '{name}'")
+
+    def list_resources(self) -> list[ResourceInfo]:
+        """Get list of available resources."""
+        return self._submit(_fetch_resources, "list resources")
+
+    def read_resource(self, uri: str) -> str:
+        """Read a resource."""
+        return self._submit(lambda s: _fetch_resource_text(s, uri), f"read resource '{uri}'")
+
+    def list_prompts(self) -> list[PromptInfo]:
+        """Get list of available prompts."""
+        return self._submit(_fetch_prompts, "list prompts")
+
+    def prefetch_all(self) -> tuple[list[ToolInfo], list[ResourceInfo], list[PromptInfo]]:
+        """List tools, resources and prompts with the three requests in flight at once."""
+        return self._submit(_fetch_all, "prefetch server metadata")
+
+    def get_prompt(self, name: str, args: dict[str, str]) -> list[dict[str, Any]]:
+        """Get a prompt."""
+        return self._submit(lambda s: _fetch_prompt_messages(s, name, args), f"get prompt '{name}'")
+
+    def close(self) -> None:
+        """Shut down the session and the server subprocess."""
+        if self._stop is not None and self._runner is not None and not self._runner.done():
+            self._loop.call_soon_threadsafe(self._stop.set)
+            try:
+                self._runner.result(timeout=5)
+            except Exception as e:
+                logger.debug(f"Error while closing MCP session: {e}")
+        get_log_collector().client_log("INFO", "Session closed")
+
+
+class _SessionManager:
+    """Process-wide registry of persistent MCP sessions.
+
+    All sessions share one event loop running on a background daemon
+    thread, created on first use. Sessions are keyed by ServerConfig, so
+    every Streamlit rerun (and every browser tab) talking to the same
+    knowledge root reuses one server process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sessions: dict[ServerConfig, MCPSession] = {}
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="mcp-client", daemon=True).start()
+        return self._loop
+
+    def get(self, config: ServerConfig) -> MCPSession:
+        """Get the open session for a server, connecting if needed.
+
+        Raises:
+            MCPClientError: If the server cannot be started
+        """
+        with self._lock:
+            session = self._sessions.get(config)
+            if session is None or not session.is_open:
+                session = MCPSession.connect(config, self._get_loop())
+                self._sessions[config] = session
+            return session
+
+    def close(self, config: ServerConfig, session: MCPSession | None = None) -> None:
+        """Close the session for one server.
+
+        With ``session``, only that session is closed, so a stale caller
+        cannot close a newer session opened for the same server.
+        """
+        with self._lock:
+            current = self._sessions.get(config)
+            if current is None or (session is not None and current is not session):
+                return
+            del self._sessions[config]
+        current.close()
+
+    def close_all(self) -> None:
+        """Close every open session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_session_manager = _SessionManager()
+atexit.register(_session_manager.close_all)
+
+
+def open_session(config: ServerConfig) -> MCPSession:
+    """Get the persistent session for a server, starting it if needed.
+
+    Raises:
+        MCPClientError: If the server cannot be started
+    """
+    return _session_manager.get(config)
+
+
+def close_session(config: ServerConfig, session: MCPSession | None = None) -> None:
+    """Close the persistent session for one server (e.g. on disconnect).
+
+    Sessions of other servers, and so other browser tabs, stay open.
+    """
+    _session_manager.close(config, session)
 
 
 # Sync wrappers for Streamlit
+#
+# Each call is a single request on the persistent session for ``config``;
+# the server is only spawned (and initialized) on first use.
 
 
 def list_tools(config: ServerConfig) -> list[ToolInfo]:
-    """Get list of available tools (sync wrapper)."""
-    collector = get_log_collector()
-    try:
-        return asyncio.run(_list_tools(config))
-    except Exception as e:
-        collector.client_log("ERROR", f"Failed to list tools: {e}")
-        raise MCPClientError(f"Failed to list tools: {e}") from e
+    """Get list of available tools."""
+    return _session_manager.get(config).list_tools()
 
 
 def call_tool(config: ServerConfig, name: str, args: dict[str, Any]) -> dict[str, Any]:
-    """Call a tool (sync wrapper)."""
-    collector = get_log_collector()
-    try:
-        return asyncio.run(_call_tool(config, name, args))
-    except Exception as e:
-        collector.client_log("ERROR", f"Failed to call tool '{name}': {e}")
-        raise MCPClientError(f"Failed to call tool '{name}': {e}") from e
+    """Call a tool."""
+    return _session_manager.get(config).call_tool(name, args)
 
 
 def list_resources(config: ServerConfig) -> list[ResourceInfo]:
-    """Get list of available resources (sync wrapper)."""
-    collector = get_log_collector()
-    try:
-        return asyncio.run(_list_resources(config))
-    except Exception as e:
-        collector.client_log("ERROR", f"Failed to list resources: {e}")
-        raise MCPClientError(f"Failed to list resources: {e}") from e
+    """Get list of available resources."""
+    return _session_manager.get(config).list_resources()
 
 
 def read_resource(config: ServerConfig, uri: str) -> str:
-    """Read a resource (sync wrapper)."""
-    collector = get_log_collector()
-    try:
-        return asyncio.run(_read_resource(config, uri))
-    except Exception as e:
-        collector.client_log("ERROR", f"Failed to read resource '{uri}': {e}")
-        raise MCPClientError(f"Failed to read resource '{uri}': {e}") from e
+    """Read a resource."""
+    return _session_manager.get(config).read_resource(uri)
 
 
 def list_prompts(config: ServerConfig) -> list[PromptInfo]:
-    """Get list of available prompts (sync wrapper)."""
-    collector = get_log_collector()
-    try:
-        return asyncio.run(_list_prompts(config))
-    except Exception as e:
-        collector.client_log("ERROR", f"Failed to list prompts: {e}")
-        raise MCPClientError(f"Failed to list prompts: {e}") from e
+    """Get list of available prompts."""
+    return _session_manager.get(config).list_prompts()
 
 
 def get_prompt(config: ServerConfig, name: str, args: dict[str, str]) -> list[dict[str, Any]]:
-    """Get a prompt (sync wrapper)."""
-    collector = get_log_collector()
-    try:
-        return asyncio.run(_get_prompt(config, name, args))
-    except Exception as e:
-        collector.client_log("ERROR", f"Failed to get prompt '{name}': {e}")
-        raise MCPClientError(f"Failed to get prompt '{name}': {e}") from e
+    """Get a prompt."""
+    return _session_manager.get(config).get_prompt(name, args)
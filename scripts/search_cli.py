@@ -6,17 +6,25 @@ Usage:
     python search_cli.py "attack armor" --scope collection --path "game"
     python search_cli.py "move|teleport" --fuzzy
     python search_cli.py '"exact phrase"' --max-results 10
+    python search_cli.py --queries-file queries.txt
+    python search_cli.py --queries-file terms.txt --batch --scope document --path "rules.pdf"
 """
 
 import argparse
 import asyncio
 import json
 import sys
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
 from typing import Any
 
 from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
 
+# search_multiple accepts at most this many terms per call
+MAX_BATCH_TERMS = 10
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -42,10 +50,26 @@ Examples:
 
   # With options
   python search_cli.py "error" --context 10 --max-results 5 --fuzzy
+
+  # Many queries over one connection (one query per line)
+  python search_cli.py --queries-file queries.txt
+
+  # Same, but as search_multiple calls against one document
+  python search_cli.py --queries-file terms.txt --batch --scope document --path "rules.pdf"
         """,
     )
 
-    parser.add_argument("query", help="Search query (supports boolean operators)")
+    parser.add_argument(
+        "query",
+        nargs="?",
+        help="Search query (supports boolean operators)",
+    )
+
+    parser.add_argument(
+        "--queries-file",
+        type=Path,
+        help="File with one query per line, all run over a single session",
+    )
 
     parser.add_argument(
         "--url",
@@ -85,6 +109,15 @@ Examples:
         help="Enable fuzzy matching",
     )
 
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Send queries to search_multiple, "
+            f"{MAX_BATCH_TERMS} per call (requires --scope document)"
+        ),
+    )
+
     parser.add_argument(
         "--json",
         action="store_true",
@@ -101,11 +134,28 @@ Examples:
     return parser.parse_args()
 
 
-async def search_documents(url: str, query: str, **kwargs: Any) -> dict[str, Any]:
-    """Call search_documents tool via MCP.
+@asynccontextmanager
+async def open_session(url: str) -> AsyncIterator[ClientSession]:
+    """Open and initialize an MCP session that can serve many queries.
 
     Args:
         url: MCP server URL
+
+    Yields:
+        Initialized client session
+    """
+    async with AsyncExitStack() as stack:
+        read, write, _get_session_id = await stack.enter_async_context(streamable_http_client(url))
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        yield session
+
+
+async def search_documents(session: ClientSession, query: str, **kwargs: Any) -> Any:
+    """Call search_documents tool via MCP.
+
+    Args:
+        session: Initialized client session (see open_session)
         query: Search query
         **kwargs: Additional search parameters (scope, path, context_lines, etc.)
 
@@ -126,15 +176,59 @@ async def search_documents(url: str, query: str, **kwargs: Any) -> dict[str, Any
         "fuzzy": kwargs.get("fuzzy", False),
     }
 
-    # Connect to MCP server
-    async with streamable_http_client(url) as (read, write, _get_session_id):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
+    return await session.call_tool("search_documents", arguments)
 
-            # Call tool
-            result = await session.call_tool("search_documents", arguments)
 
-            return result
+async def search_multiple(
+    session: ClientSession, document_path: str, terms: list[str], **kwargs: Any
+) -> Any:
+    """Call search_multiple tool via MCP.
+
+    Args:
+        session: Initialized client session (see open_session)
+        document_path: Document to search in
+        terms: Search terms (at most MAX_BATCH_TERMS)
+        **kwargs: Additional search parameters (context, fuzzy)
+
+    Returns:
+        Tool result
+    """
+    arguments = {
+        "document_path": document_path,
+        "terms": terms,
+        "context_lines": kwargs.get("context", 5),
+        "fuzzy": kwargs.get("fuzzy", False),
+    }
+
+    return await session.call_tool("search_multiple", arguments)
+
+
+def read_queries(path: Path) -> list[str]:
+    """Read one query per line, skipping blank lines.
+
+    Args:
+        path: Queries file
+
+    Returns:
+        List of queries
+    """
+    with path.open(encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def result_to_dict(result: Any) -> dict[str, Any]:
+    """Convert tool result to a JSON-serializable dict.
+
+    Args:
+        result: MCP tool result
+
+    Returns:
+        Dict with content and isError
+    """
+    return {
+        "content": [{"type": c.type, "text": getattr(c, "text", None)} for c in result.content],
+        "isError": getattr(result, "isError", False),
+    }
 
 
 def format_result(result: Any, verbose: bool = False) -> str:
@@ -151,11 +245,10 @@ def format_result(result: Any, verbose: bool = False) -> str:
         return "No results found."
 
     # Extract text content
-    text_content = None
-    for content in result.content:
-        if hasattr(content, "text"):
-            text_content = content.text
-            break
+    text_content = next(
+        (text for c in result.content if (text := getattr(c, "text", None)) is not None),
+        None,
+    )
 
     if not text_content:
         return "No text content in result."
@@ -171,6 +264,14 @@ async def main() -> int:
     args = parse_args()
 
     # Validate arguments
+    if args.query is None and args.queries_file is None:
+        print("Error: provide a query or --queries-file", file=sys.stderr)
+        return 1
+
+    if args.batch and args.scope != "document":
+        print("Error: --batch requires --scope document", file=sys.stderr)
+        return 1
+
     if args.scope in ("collection", "document") and not args.path:
         print(
             f"Error: --path is required when --scope is '{args.scope}'",
@@ -180,43 +281,74 @@ async def main() -> int:
 
     # Display search parameters
     if args.verbose:
-        print("=== Search Parameters ===", file=sys.stderr)
-        print(f"URL: {args.url}", file=sys.stderr)
-        print(f"Query: {args.query}", file=sys.stderr)
-        print(f"Scope: {args.scope}", file=sys.stderr)
+        lines = ["=== Search Parameters ===", f"URL: {args.url}"]
+        if args.query is not None:
+            lines.append(f"Query: {args.query}")
+        if args.queries_file is not None:
+            lines.append(f"Queries file: {args.queries_file}")
+        if args.batch:
+            lines.append("Batch: search_multiple")
+        lines.append(f"Scope: {args.scope}")
         if args.path:
-            print(f"Path: {args.path}", file=sys.stderr)
-        print(f"Context lines: {args.context}", file=sys.stderr)
-        print(f"Max results: {args.max_results}", file=sys.stderr)
-        print(f"Fuzzy: {args.fuzzy}", file=sys.stderr)
-        print(file=sys.stderr)
+            lines.append(f"Path: {args.path}")
+        lines.append(f"Context lines: {args.context}")
+        lines.append(f"Max results: {args.max_results}")
+        lines.append(f"Fuzzy: {args.fuzzy}")
+        sys.stderr.write("\n".join(lines) + "\n\n")
 
     try:
-        # Execute search
-        result = await search_documents(
-            args.url,
-            args.query,
-            scope=args.scope,
-            path=args.path,
-            context=args.context,
-            max_results=args.max_results,
-            fuzzy=args.fuzzy,
-        )
+        queries = [] if args.query is None else [args.query]
+        if args.queries_file is not None:
+            queries.extend(read_queries(args.queries_file))
+
+        # Execute all searches over one session; requests are multiplexed
+        async with open_session(args.url) as session:
+            if args.batch:
+                batches = [
+                    queries[i : i + MAX_BATCH_TERMS]
+                    for i in range(0, len(queries), MAX_BATCH_TERMS)
+                ]
+                queries = [", ".join(batch) for batch in batches]
+                calls = [
+                    search_multiple(
+                        session, args.path, batch, context=args.context, fuzzy=args.fuzzy
+                    )
+                    for batch in batches
+                ]
+            else:
+                calls = [
+                    search_documents(
+                        session,
+                        query,
+                        scope=args.scope,
+                        path=args.path,
+                        context=args.context,
+                        max_results=args.max_results,
+                        fuzzy=args.fuzzy,
+                    )
+                    for query in queries
+                ]
+            results = await asyncio.gather(*calls)
 
         # Output result
         if args.json:
             # Output raw JSON
-            output = {
-                "content": [
-                    {"type": c.type, "text": c.text if hasattr(c, "text") else None}
-                    for c in result.content
-                ],
-                "isError": result.isError if hasattr(result, "isError") else False,
-            }
+            if len(queries) == 1:
+                output: Any = result_to_dict(results[0])
+            else:
+                output = [
+                    {"query": query, **result_to_dict(result)}
+                    for query, result in zip(queries, results, strict=True)
+                ]
             print(json.dumps(output, indent=2, ensure_ascii=False))
-        else:
+        elif len(queries) == 1:
             # Format and print
-            print(format_result(result, verbose=args.verbose))
+            print(format_result(results[0], verbose=args.verbose))
+        else:
+            for query, result in zip(queries, results, strict=True):
+                print(f"=== Query: {query} ===")
+                print(format_result(result, verbose=args.verbose))
+                print()
 
         return 0
 
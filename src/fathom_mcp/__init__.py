@@ -1,5 +1,8 @@
 """Fathom MCP - File-first knowledge base MCP server."""
 
+# Keep this module import-light: the Docker healthcheck imports it and
+# rejects heavy transitive imports (streamlit, pandas, httpx).
+
 try:
     from importlib.metadata import version
 
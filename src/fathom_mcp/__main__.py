@@ -6,13 +6,22 @@ import contextlib
 import logging
 import os
 import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from .config import Config, ConfigError, load_config
-from .search.ugrep import check_ugrep_installed
-from .server import run_server
+if TYPE_CHECKING:
+    from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Matches the --log-level choices and ServerConfig.log_level
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 
 def setup_event_loop() -> None:
     """Setup event loop with Windows compatibility.
@@ -34,7 +43,26 @@ def setup_event_loop() -> None:
     asyncio.set_event_loop(loop)
 
 
-def validate_permissions(config: Config) -> None:
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get uvloop's loop factory when uvloop is installed.
+
+    uvloop is optional (``pip install uvloop``) and not available on Windows.
+
+    Returns:
+        uvloop.new_event_loop, or None to use the default asyncio loop
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    logger.debug("Using uvloop event loop")
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def validate_permissions(config: "Config") -> None:
     """Validate runtime permissions.
 
     Check file access and port binding permissions.
@@ -114,13 +142,19 @@ def main() -> None:
     )
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        choices=list(_LOG_LEVELS),
         default=None,
         help="Log level (overrides config)",
     )
 
     args = parser.parse_args()
 
+    # Imported after parsing so --help and argument errors exit before
+    # pydantic, yaml and the mcp server stack are loaded
+    from .config import Config, ConfigError, KnowledgeConfig, load_config
+    from .search.ugrep import check_ugrep_installed
+    from .server import run_server
+
     # Check ugrep
     if not check_ugrep_installed():
         print("ERROR: ugrep is not installed.", file=sys.stderr)
@@ -134,8 +168,6 @@ def main() -> None:
     try:
         # If --root provided without config, create minimal config
         if args.root and not args.config:
-            from .config import Config, KnowledgeConfig
-
             config = Config(knowledge=KnowledgeConfig(root=args.root))
         else:
             config = load_config(args.config)
@@ -149,7 +181,7 @@ def main() -> None:
     # Override log level if provided
     log_level = args.log_level or config.server.log_level
     logging.basicConfig(
-        level=getattr(logging, log_level),
+        level=_LOG_LEVELS[log_level],
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
@@ -157,7 +189,7 @@ def main() -> None:
 
     # Run server
     with contextlib.suppress(KeyboardInterrupt):
-        asyncio.run(run_server(config))
+        asyncio.run(run_server(config), loop_factory=get_loop_factory())
 
 
 if __name__ == "__main__":
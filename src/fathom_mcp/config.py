@@ -1,10 +1,10 @@
 """Configuration management with Pydantic."""
 
+import functools
 import os
 from pathlib import Path, PurePosixPath
-from typing import Any, Literal
+from typing import IO, Any, Literal, NamedTuple
 
-import yaml
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,6 +17,14 @@ class FormatConfig(BaseModel):
     extensions: list[str]
 
 
+class _FormatLookup(NamedTuple):
+    """Per-extension format data derived from Config.formats."""
+
+    ext_to_filter: dict[str, str | None]  # lowercase extension with dot -> filter
+    extensions: frozenset[str]  # as configured, for ugrep --include globs
+    needs_filters: bool
+
+
 class SearchConfig(BaseModel):
     """Search engine settings."""
 
@@ -103,13 +111,13 @@ class PerformanceConfig(BaseModel):
     # Parallel PDF processing
     enable_parallel_pdf: bool = Field(
         default=True,
-        description="Process PDF pages in parallel",
+        description="Process PDF pages in parallel (pypdf only; not used with pypdfium2)",
     )
     max_pdf_workers: int = Field(
         default=4,
         ge=1,
         le=16,
-        description="Maximum parallel workers for PDF processing",
+        description="Maximum parallel workers for PDF processing (pypdf only)",
     )
 
 
@@ -591,14 +599,61 @@ class Config(BaseSettings):
         }
     )
 
-    @property
-    def supported_extensions(self) -> set[str]:
-        """Get all enabled file extensions."""
-        exts = set()
+    def invalidate_format_cache(self) -> None:
+        """Rebuild the extension lookup on next use.
+
+        Call after changing a format in place (enabled, filter or extensions).
+        Assigning a new formats dict is picked up without it.
+        """
+        self.__dict__.pop("_format_cache", None)
+
+    @functools.cached_property
+    def _format_cache(self) -> tuple[dict[str, FormatConfig], _FormatLookup]:
+        """Build the lookup tables, paired with the formats dict they came from.
+
+        A cached_property lives in the instance __dict__, so reading it skips
+        pydantic's slower private attribute access.
+        """
+        ext_map: dict[str, str | None] = {}
+        extensions: set[str] = set()
+        needs_filters = False
         for fmt in self.formats.values():
             if fmt.enabled:
-                exts.update(fmt.extensions)
-        return exts
+                needs_filters = needs_filters or fmt.filter is not None
+                extensions.update(fmt.extensions)
+                for ext in fmt.extensions:
+                    ext_map.setdefault(ext.lower(), fmt.filter)
+        return self.formats, _FormatLookup(ext_map, frozenset(extensions), needs_filters)
+
+    def _format_lookup(self) -> _FormatLookup:
+        """Get extension and filter data for the enabled formats.
+
+        Built once per formats dict, until invalidate_format_cache() is called.
+
+        Returns:
+            Lookup tables derived from formats
+        """
+        formats, lookup = self._format_cache
+        if formats is not self.formats:
+            self.invalidate_format_cache()
+            formats, lookup = self._format_cache
+        return lookup
+
+    @property
+    def supported_extensions(self) -> frozenset[str]:
+        """Get all enabled file extensions, as configured."""
+        return self._format_lookup().extensions
+
+    def is_supported_extension(self, ext: str) -> bool:
+        """Check if a file extension belongs to an enabled format.
+
+        Args:
+            ext: File extension with leading dot, matched case-insensitively
+
+        Returns:
+            True if some enabled format lists the extension
+        """
+        return ext.lower() in self._format_lookup().ext_to_filter
 
     def get_filter_for_extension(self, ext: str) -> str | None:
         """Get filter command for a file extension.
@@ -613,11 +668,7 @@ class Config(BaseSettings):
         if not ext.startswith("."):
             ext = f".{ext}"
 
-        for fmt_config in self.formats.values():
-            if fmt_config.enabled and ext in fmt_config.extensions:
-                return fmt_config.filter
-
-        return None
+        return self._format_lookup().ext_to_filter.get(ext)
 
     def needs_document_filters(self) -> bool:
         """Check if any enabled formats require filter commands.
@@ -625,9 +676,10 @@ class Config(BaseSettings):
         Returns:
             True if at least one enabled format has a filter command
         """
-        return any(fmt.enabled and fmt.filter is not None for fmt in self.formats.values())
+        return self._format_lookup().needs_filters
 
-    def prepare_filter_for_stdin(self, filter_cmd: str) -> str:
+    @staticmethod
+    def prepare_filter_for_stdin(filter_cmd: str) -> str:
         """Convert ugrep filter syntax (%) to stdin-compatible syntax (-).
 
         Args:
@@ -636,14 +688,20 @@ class Config(BaseSettings):
         Returns:
             Filter command with stdin syntax
         """
-        # Only replace % when it's used as a filename placeholder
-        # ugrep uses % as the filename placeholder
-        if " % " in filter_cmd:
-            return filter_cmd.replace(" % ", " - ")
-        elif filter_cmd.endswith(" %"):
-            return filter_cmd[:-2] + " -"
-        # If no %, assume stdin already
-        return filter_cmd
+        return _stdin_filter(filter_cmd)
+
+
+@functools.cache
+def _stdin_filter(filter_cmd: str) -> str:
+    """Convert a filter command once; there are only a handful of distinct ones."""
+    # Only replace % when it's used as a filename placeholder
+    # ugrep uses % as the filename placeholder
+    if " % " in filter_cmd:
+        return filter_cmd.replace(" % ", " - ")
+    elif filter_cmd.endswith(" %"):
+        return filter_cmd[:-2] + " -"
+    # If no %, assume stdin already
+    return filter_cmd
 
 
 class ConfigError(Exception):
@@ -652,6 +710,31 @@ class ConfigError(Exception):
     pass
 
 
+# Config built from defaults and FMCP_* variables alone, keyed by those
+# variables. load_config returns deep copies since callers mutate the result.
+_default_config: tuple[tuple[tuple[str, str], ...], Config] | None = None
+
+
+def _default_config_copy() -> Config:
+    """Build (or reuse) the file-less Config and return a private copy."""
+    global _default_config
+
+    prefix = Config.model_config.get("env_prefix", "").upper()
+    env_key = tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith(prefix)))
+    if _default_config is None or _default_config[0] != env_key:
+        _default_config = (env_key, Config())  # type: ignore[call-arg]  # knowledge from env
+    return _default_config[1].model_copy(deep=True)
+
+
+def _load_yaml(stream: IO[bytes]) -> Any:
+    """Parse a YAML config file, importing PyYAML only when one is loaded."""
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it (bundled in the wheels)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
 def load_config(config_path: str | Path | None = None) -> Config:
     """Load configuration from YAML file or defaults.
 
@@ -670,13 +753,20 @@ def load_config(config_path: str | Path | None = None) -> Config:
         path = Path(config_path)
         if not path.exists():
             raise ConfigError(f"Config file not found: {path}")
-        config_data = yaml.safe_load(path.read_text()) or {}
+        with path.open("rb") as f:
+            config_data = _load_yaml(f) or {}
     else:
         # Try default locations
         for default in [Path("./config.yaml"), Path("./config.yml")]:
             if default.exists():
-                config_data = yaml.safe_load(default.read_text()) or {}
+                with default.open("rb") as f:
+                    config_data = _load_yaml(f) or {}
                 break
+        else:
+            try:
+                return _default_config_copy()
+            except Exception as e:
+                raise ConfigError(f"Invalid configuration: {e}") from e
 
     try:
         return Config(**config_data)
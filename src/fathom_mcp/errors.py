@@ -16,8 +16,12 @@ class ErrorCategory(str, Enum):
     FATAL_ERROR = "fatal"  # Permanent, non-retry-able
 
 
-class ErrorCode(str, Enum):
-    """Error codes following JSON-RPC conventions."""
+class ErrorCode:
+    """Error codes following JSON-RPC conventions.
+
+    Plain string constants rather than an Enum, so a code is an ordinary
+    ``str`` and needs no ``.value`` when serialized.
+    """
 
     # JSON-RPC standard errors
     INVALID_PARAMS = "-32602"
@@ -62,9 +66,13 @@ class McpError(Exception):
         data: Additional error data
     """
 
+    # BaseException allocates its instance __dict__ lazily; keeping every
+    # attribute in a slot means it is never created
+    __slots__ = ("code", "message", "data", "category", "http_status", "retry_able")
+
     def __init__(
         self,
-        code: ErrorCode,
+        code: str,
         message: str,
         data: dict[str, Any] | None = None,
         category: ErrorCategory = ErrorCategory.SERVER_ERROR,
@@ -83,7 +91,7 @@ class McpError(Exception):
         """Convert to MCP error response format."""
         return {
             "error": {
-                "code": self.code.value,
+                "code": self.code,
                 "message": self.message,
                 "data": self.data,
             }
@@ -96,7 +104,7 @@ class McpError(Exception):
             Dict with error details
         """
         return {
-            "code": self.code.value,
+            "code": self.code,
             "message": self.message,
             "category": self.category.value,
             "retry_able": self.retry_able,
@@ -171,7 +171,7 @@ async def error_handler(request: Request, exc: Exception) -> JSONResponse:
             extra={
                 "extra_fields": {
                     "request_id": request_id,
-                    "error_code": exc.code.value,
+                    "error_code": exc.code,
                     "retry_able": exc.retry_able,
                 }
             },
@@ -181,7 +181,7 @@ async def error_handler(request: Request, exc: Exception) -> JSONResponse:
             status_code=exc.http_status,
             content={
                 "error": {
-                    "code": exc.code.value,
+                    "code": exc.code,
                     "message": exc.message,
                     "category": exc.category.value,
                     "retry_able": exc.retry_able,
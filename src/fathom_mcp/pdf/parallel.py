@@ -4,14 +4,71 @@ import asyncio
 import contextlib
 import functools
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pypdf import PdfReader
+if TYPE_CHECKING:
+    from pypdf import PdfReader
 
 logger = logging.getLogger(__name__)
 
+# Reads of more pages than this are extracted in worker processes; below it,
+# re-parsing the PDF in each worker costs more than the parallelism saves.
+PROCESS_POOL_MIN_PAGES = 8
+
+
+# Shared process pools for CPU-bound page extraction, keyed by worker count
+_process_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool for CPU-bound page extraction.
+
+    pypdf extraction is pure Python, so threads serialize on the GIL. The pool
+    lives until shutdown_process_pools() to pay worker start-up only once.
+    """
+    pool = _process_pools.get(max_workers)
+    if pool is None:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        _process_pools[max_workers] = pool
+    return pool
+
+
+def _discard_process_pool(max_workers: int, pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next large read starts a fresh one."""
+    if _process_pools.get(max_workers) is pool:
+        del _process_pools[max_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pools() -> None:
+    """Shut down the shared extraction pools (called on server shutdown)."""
+    while _process_pools:
+        _, pool = _process_pools.popitem()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _open_reader(pdf_path: str | Path) -> "PdfReader":
+    """Parse a PDF, importing pypdf on first use to keep server startup fast."""
+    from pypdf import PdfReader
+
+    return PdfReader(pdf_path)
+
+
+def _extract_chunk_from_file(pdf_path: str, page_indices: list[int], include_markers: bool) -> str:
+    """Extract text from a chunk of pages with a reader of its own.
+
+    Runs in a worker process, which cannot share the caller's reader.
+    """
+    return ParallelPDFProcessor._extract_chunk(
+        _open_reader(pdf_path), page_indices, include_markers
+    )
+
 
 class ParallelPDFProcessor:
     """Process PDF pages in parallel for better performance."""
@@ -41,9 +98,30 @@ class ParallelPDFProcessor:
         Returns:
             Extracted text content
         """
+        text, _, _ = await self.extract_pages_parallel(pdf_path, pages, include_page_markers)
+        return text
+
+    async def extract_pages_parallel(
+        self,
+        pdf_path: Path,
+        pages: list[int] | None = None,
+        include_page_markers: bool = True,
+        max_chars: int | None = None,
+    ) -> tuple[str, int, list[int]]:
+        """Extract text from PDF pages in parallel, stopping early past max_chars.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Specific page numbers to extract (1-indexed). None = all pages
+            include_page_markers: Whether to include "--- Page N ---" markers
+            max_chars: Stop extracting once the text is longer than this. None = no limit
+
+        Returns:
+            Tuple of (extracted text, total page count, 1-indexed pages read)
+        """
         # Load PDF reader in thread pool
         loop = asyncio.get_event_loop()
-        reader = await loop.run_in_executor(self._executor, PdfReader, pdf_path)
+        reader = await loop.run_in_executor(self._executor, _open_reader, pdf_path)
         total_pages = len(reader.pages)
 
         # Determine which pages to process
@@ -54,37 +132,101 @@ class ParallelPDFProcessor:
             page_indices = list(range(total_pages))
 
         if not page_indices:
-            return ""
+            return "", total_pages, []
 
         logger.debug(
             f"Extracting text from {len(page_indices)} pages using {self.max_workers} workers"
         )
 
-        # Process pages in chunks for better parallelization
-        chunk_size = max(1, len(page_indices) // self.max_workers)
-        chunks = [page_indices[i : i + chunk_size] for i in range(0, len(page_indices), chunk_size)]
-
-        # Process chunks in parallel
-        tasks = [
-            loop.run_in_executor(
+        # Small reads: one serial pass with the reader already parsed above,
+        # since pypdf threads serialize on the GIL anyway
+        if len(page_indices) <= PROCESS_POOL_MIN_PAGES:
+            text, pages_read = await loop.run_in_executor(
                 self._executor,
-                functools.partial(self._extract_chunk, reader, chunk, include_page_markers),
+                self._extract_pages,
+                reader,
+                page_indices,
+                include_page_markers,
+                max_chars,
             )
-            for chunk in chunks
-        ]
+            return text, total_pages, pages_read
 
-        results = await asyncio.gather(*tasks)
+        # Large reads: process chunks in parallel in worker processes
+        chunk_size = max(1, len(page_indices) // self.max_workers)
+        if max_chars is not None:
+            # Smaller chunks, extracted one wave of workers at a time, so a capped
+            # read stops soon after the limit instead of extracting every page
+            chunk_size = min(chunk_size, PROCESS_POOL_MIN_PAGES)
+        chunks = [page_indices[i : i + chunk_size] for i in range(0, len(page_indices), chunk_size)]
+        try:
+            results = await self._extract_chunks_in_processes(
+                pdf_path, chunks, include_page_markers, max_chars
+            )
+        except BrokenProcessPool:
+            # A worker died (crash, OOM kill); retry once on a fresh pool
+            logger.warning("PDF worker process died, retrying with a new process pool")
+            results = await self._extract_chunks_in_processes(
+                pdf_path, chunks, include_page_markers, max_chars
+            )
 
         # Combine results
-        return "\n".join(results)
+        pages_read = [idx + 1 for chunk in chunks[: len(results)] for idx in chunk]
+        return "\n".join(results), total_pages, pages_read
 
-    def _extract_chunk(
+    async def _extract_chunks_in_processes(
         self,
-        reader: PdfReader,
+        pdf_path: Path,
+        chunks: list[list[int]],
+        include_markers: bool,
+        max_chars: int | None = None,
+    ) -> list[str]:
+        """Extract chunks in the shared process pool, discarding it if it breaks.
+
+        With max_chars, chunks are submitted one wave of max_workers at a time
+        and no further waves start once the text is past the limit.
+        """
+        pool = _process_pool(self.max_workers)
+        wave_size = len(chunks) if max_chars is None else self.max_workers
+        texts: list[str] = []
+        length = -1  # Length of the joined text: one "\n" fewer than chunks
+        try:
+            for start in range(0, len(chunks), wave_size):
+                wave = chunks[start : start + wave_size]
+                for text in await self._extract_chunks(pool, pdf_path, wave, include_markers):
+                    texts.append(text)
+                    length += len(text) + 1
+                if max_chars is not None and length > max_chars:
+                    break
+        except BrokenProcessPool:
+            _discard_process_pool(self.max_workers, pool)
+            raise
+        return texts
+
+    @staticmethod
+    async def _extract_chunks(
+        executor: Executor, pdf_path: Path, chunks: list[list[int]], include_markers: bool
+    ) -> list[str]:
+        """Run one extraction per chunk on the executor, keeping chunk order."""
+        loop = asyncio.get_running_loop()
+        extract = functools.partial(_extract_chunk_from_file, str(pdf_path))
+        tasks = [
+            loop.run_in_executor(executor, extract, chunk, include_markers) for chunk in chunks
+        ]
+        # Wait for every chunk so a broken pool does not leave unretrieved errors
+        texts: list[str] = []
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+            texts.append(result)
+        return texts
+
+    @staticmethod
+    def _extract_chunk(
+        reader: "PdfReader",
         page_indices: list[int],
         include_markers: bool,
     ) -> str:
-        """Extract text from a chunk of pages (runs in thread pool).
+        """Extract text from a chunk of pages (runs in thread or process pool).
 
         Args:
             reader: PdfReader instance
@@ -94,23 +236,47 @@ class ParallelPDFProcessor:
         Returns:
             Extracted text for this chunk
         """
+        text, _ = ParallelPDFProcessor._extract_pages(reader, page_indices, include_markers)
+        return text
+
+    @staticmethod
+    def _extract_pages(
+        reader: "PdfReader",
+        page_indices: list[int],
+        include_markers: bool,
+        max_chars: int | None = None,
+    ) -> tuple[str, list[int]]:
+        """Extract text from pages in order, stopping at the first page past max_chars.
+
+        Returns:
+            Tuple of (extracted text, 1-indexed pages read)
+        """
         text_parts = []
+        pages_read = []
+        length = -1  # Length of the joined text: one "\n" fewer than parts
 
         for idx in page_indices:
+            parts = []
             try:
                 if include_markers:
                     page_num = idx + 1
-                    text_parts.append(f"--- Page {page_num} ---")
+                    parts.append(f"--- Page {page_num} ---")
 
                 page_text = reader.pages[idx].extract_text() or ""
-                text_parts.append(page_text)
+                parts.append(page_text)
 
             except Exception as e:
                 logger.error(f"Failed to extract text from page {idx}: {e}")
                 if include_markers:
-                    text_parts.append(f"[Error extracting page {idx + 1}]")
+                    parts.append(f"[Error extracting page {idx + 1}]")
+
+            text_parts += parts
+            pages_read.append(idx + 1)
+            length += sum(len(part) + 1 for part in parts)
+            if max_chars is not None and length > max_chars:
+                break
 
-        return "\n".join(text_parts)
+        return "\n".join(text_parts), pages_read
 
     async def extract_metadata(self, pdf_path: Path) -> dict[str, Any]:
         """Extract PDF metadata in parallel.
@@ -122,7 +288,7 @@ class ParallelPDFProcessor:
             Dictionary with metadata including page count, TOC, etc.
         """
         loop = asyncio.get_event_loop()
-        reader = await loop.run_in_executor(self._executor, PdfReader, pdf_path)
+        reader = await loop.run_in_executor(self._executor, _open_reader, pdf_path)
 
         metadata: dict[str, Any] = {
             "pages": len(reader.pages),
@@ -149,7 +315,7 @@ class ParallelPDFProcessor:
 
         return metadata
 
-    def _extract_pdf_metadata(self, reader: PdfReader) -> dict[str, Any]:
+    def _extract_pdf_metadata(self, reader: "PdfReader") -> dict[str, Any]:
         """Extract PDF document metadata (runs in thread pool)."""
         meta = {}
 
@@ -165,7 +331,7 @@ class ParallelPDFProcessor:
 
         return meta
 
-    def _extract_toc(self, reader: PdfReader) -> list[dict[str, Any]] | None:
+    def _extract_toc(self, reader: "PdfReader") -> list[dict[str, Any]] | None:
         """Extract PDF table of contents (runs in thread pool)."""
         try:
             outlines = reader.outline
@@ -177,7 +343,7 @@ class ParallelPDFProcessor:
         return None
 
     def _parse_outlines(
-        self, reader: PdfReader, outlines: Any, depth: int = 0
+        self, reader: "PdfReader", outlines: Any, depth: int = 0
     ) -> list[dict[str, Any]]:
         """Recursively parse PDF outlines into TOC structure."""
         if depth > 5:  # Limit depth
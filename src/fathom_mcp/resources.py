@@ -2,6 +2,12 @@
 
 import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
 
 from mcp.server import Server
 from mcp.types import Resource, ResourceTemplate
@@ -11,8 +17,58 @@ from .config import Config
 from .errors import ErrorCode, McpError, collection_not_found, document_not_found
 from .security import FileAccessControl
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
 logger = logging.getLogger(__name__)
 
+# Serialized index JSON per directory, valid while the directory's mtime is
+# unchanged (adding, removing or renaming an entry updates it). LRU-ordered.
+_index_cache: OrderedDict[tuple[Any, ...], tuple[int, str]] = OrderedDict()
+
+# Directories modified more recently than this may change again without a
+# visible mtime change on coarse-timestamp filesystems, so they aren't cached
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+def _cached_index(
+    key: tuple[Any, ...], directory: Path, max_size: int, build: Callable[[], str]
+) -> str:
+    """Return cached index JSON for directory, rebuilding when its mtime changes.
+
+    Args:
+        key: Cache key (directory plus anything else the output depends on)
+        directory: Directory whose mtime validates the entry
+        max_size: Maximum number of cached indexes
+        build: Builds the index JSON on a miss
+
+    Returns:
+        Index JSON string
+    """
+    mtime = directory.stat().st_mtime_ns
+    cached = _index_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        _index_cache.move_to_end(key)
+        return cached[1]
+
+    result = build()
+    if time.time_ns() - mtime > _RACY_WINDOW_NS:
+        _index_cache[key] = (mtime, result)
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > max_size:
+            _index_cache.popitem(last=False)
+    return result
+
+
+def _to_json(obj: Any) -> str:
+    """Serialize a resource payload as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        text: str = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return text
+    return json.dumps(obj, indent=2)
+
 
 def register_resources(server: Server, config: Config) -> None:
     """Register MCP resources."""
@@ -74,19 +130,13 @@ def register_resources(server: Server, config: Config) -> None:
                 data={"uri": uri_str},
             )
 
-        path_and_type = uri_str[len("knowledge://") :]
+        # Split "path/type" into path and "/type" ("index" alone has no path)
+        path, sep, kind = uri_str[len("knowledge://") :].rpartition("/")
+        reader = _RESOURCE_READERS.get(sep + kind)
 
         try:
-            if path_and_type == "index":
-                return await _get_root_index(config)
-
-            if path_and_type.endswith("/index"):
-                path = path_and_type[:-6]  # Remove "/index"
-                return await _get_collection_index(config, path)
-
-            if path_and_type.endswith("/info"):
-                path = path_and_type[:-5]  # Remove "/info"
-                return await _get_document_info_resource(config, path)
+            if reader is not None:
+                return await reader(config, path)
 
             logger.warning(f"Unknown resource type requested: {uri_str}")
             raise McpError(
@@ -113,27 +163,43 @@ def register_resources(server: Server, config: Config) -> None:
             ) from e
 
 
+async def _read_root_index(config: Config, path: str) -> str:
+    """Adapt _get_root_index to the (config, path) reader signature."""
+    return await _get_root_index(config)
+
+
 async def _get_root_index(config: Config) -> str:
     """Get root index as JSON."""
     root = config.knowledge.root
+    return _cached_index(
+        ("root", root),
+        root,
+        config.performance.cache_max_size,
+        lambda: _build_root_index(root),
+    )
+
+
+def _build_root_index(root: Path) -> str:
+    """List top-level collections of root as JSON."""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
 
     collections = []
-    for item in sorted(root.iterdir()):
-        if item.is_dir() and not item.name.startswith("."):
+    for entry in entries:
+        if entry.is_dir() and not entry.name.startswith("."):
             collections.append(
                 {
-                    "name": item.name,
-                    "path": item.name,
+                    "name": entry.name,
+                    "path": entry.name,
                     "type": "collection",
                 }
             )
 
-    return json.dumps(
+    return _to_json(
         {
             "collections": collections,
             "root": str(root),
-        },
-        indent=2,
+        }
     )
 
 
@@ -162,30 +228,45 @@ async def _get_collection_index(config: Config, path: str) -> str:
         logger.warning(f"Path is not a collection (directory): {path}")
         raise collection_not_found(path)
 
+    return _cached_index(
+        ("collection", full_path, path, config.supported_extensions),
+        full_path,
+        config.performance.cache_max_size,
+        lambda: _build_collection_index(full_path, path, config),
+    )
+
+
+def _build_collection_index(full_path: Path, path: str, config: Config) -> str:
+    """List subcollections and supported documents of full_path as JSON."""
+    # DirEntry caches the file type from the directory read, so is_dir()
+    # needs no extra stat() per entry
+    with os.scandir(full_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
     items = []
-    for item in sorted(full_path.iterdir()):
-        if item.name.startswith("."):
+    for entry in entries:
+        if entry.name.startswith("."):
             continue
 
-        if item.is_dir():
+        if entry.is_dir():
             items.append(
                 {
-                    "name": item.name,
-                    "path": f"{path}/{item.name}",
+                    "name": entry.name,
+                    "path": f"{path}/{entry.name}",
                     "type": "collection",
                 }
             )
-        elif item.suffix.lower() in config.supported_extensions:
+        elif config.is_supported_extension(ext := os.path.splitext(entry.name)[1].lower()):
             items.append(
                 {
-                    "name": item.name,
-                    "path": f"{path}/{item.name}",
+                    "name": entry.name,
+                    "path": f"{path}/{entry.name}",
                     "type": "document",
-                    "format": item.suffix.lower().lstrip("."),
+                    "format": ext[1:],
                 }
             )
 
-    return json.dumps({"items": items, "path": path}, indent=2)
+    return _to_json({"items": items, "path": path})
 
 
 async def _get_document_info_resource(config: Config, path: str) -> str:
@@ -216,4 +297,12 @@ async def _get_document_info_resource(config: Config, path: str) -> str:
         raise document_not_found(path)
 
     info = await _get_document_info(config, {"path": path})
-    return json.dumps(info, indent=2)
+    return _to_json(info)
+
+
+# Resource readers keyed by URI suffix: "index" (root) or "/index", "/info"
+_RESOURCE_READERS: dict[str, Callable[[Config, str], Awaitable[str]]] = {
+    "index": _read_root_index,
+    "/index": _get_collection_index,
+    "/info": _get_document_info_resource,
+}
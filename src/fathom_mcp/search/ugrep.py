@@ -15,6 +15,14 @@ from .filter_builder import FilterArgumentsBuilder
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from ugrep's stdout per await while streaming
+_READ_CHUNK_SIZE = 64 * 1024
+
+# ugrep output line formats, compiled once. Match lines are tried first because a
+# path like notes-2024-01.md would also parse as a context line.
+_MATCH_LINE_RE = re.compile(r"^(.+?):(\d+):(.*)$")  # filename:line_number:text
+_CONTEXT_LINE_RE = re.compile(r"^(.+?)-(\d+)-(.*)$")  # filename-line_number-text
+
 
 @dataclass
 class SearchMatch:
@@ -32,12 +40,113 @@ class SearchResult:
     """Search operation result."""
 
     matches: list[SearchMatch]
-    total_matches: int
+    total_matches: int  # Lower bound when truncated: ugrep stops early past max_results
     truncated: bool
     query: str
     searched_path: str
 
 
+def _split_line(line: str, sep: str, pattern: re.Pattern[str]) -> tuple[str, str, str] | None:
+    """Split an output line into (path, line_number, text), or None if it has no such form.
+
+    str.split covers the usual case; the regex is only needed when the first separator
+    belongs to the path, such as a Windows drive colon. isdecimal() accepts exactly
+    the digits \\d does, so both paths agree.
+    """
+    parts = line.split(sep, 2)
+    if len(parts) == 3 and parts[0] and parts[1].isdecimal():
+        return parts[0], parts[1], parts[2]
+    if len(parts) == 1:
+        return None
+    match = pattern.match(line)
+    if match is None:
+        return None
+    return match.group(1), match.group(2), match.group(3)
+
+
+class _OutputParser:
+    """Incremental parser for ugrep's grep-style output.
+
+    Lines are fed one at a time as ugrep writes them. Only the first
+    ``max_matches`` matches are built; later match lines are just counted.
+    """
+
+    def __init__(self, base_path: Path, max_matches: int | None = None):
+        self.base_path = base_path
+        self.max_matches = max_matches
+        self.matches: list[SearchMatch] = []
+        self.total_matches = 0
+        self._current: SearchMatch | None = None
+        self._context_before: list[str] = []
+        self._rel_paths: dict[str, str] = {}  # Matches repeat their file's path
+
+    def _flush(self) -> None:
+        if self._current:
+            self.matches.append(self._current)
+            self._current = None
+
+    def feed(self, line: str) -> None:
+        """Parse one output line (without its newline)."""
+        if not line:
+            self._flush()
+            self._context_before = []
+            return
+
+        # Parse line format:
+        # Match lines: filename:line_number:text
+        # Context lines: filename-line_number-text
+        # Note: On Windows, paths may contain ':' (e.g., C:\path\file.txt)
+
+        # Try match line first (colon separator)
+        parts = _split_line(line, ":", _MATCH_LINE_RE)
+        if parts:
+            self._flush()
+            self.total_matches += 1
+            if self.max_matches is not None and self.total_matches > self.max_matches:
+                # Past the limit: count only, drop this match's context
+                self._context_before = []
+                return
+
+            file_path, line_num, text = parts
+            self._current = SearchMatch(
+                file=self._relative_path(file_path),
+                line_number=int(line_num),
+                text=text,
+                context_before=self._context_before,
+                context_after=[],
+            )
+            self._context_before = []
+            return
+
+        # Context lines use - instead of :
+        parts = _split_line(line, "-", _CONTEXT_LINE_RE)
+        text = parts[2] if parts else line
+
+        # Anything that is neither match nor context line is treated as context
+        if self._current:
+            self._current.context_after.append(text)
+        else:
+            self._context_before.append(text)
+
+    def _relative_path(self, file_path: str) -> str:
+        """Make a matched file path relative to the base path."""
+        rel = self._rel_paths.get(file_path)
+        if rel is None:
+            # Make relative to base
+            try:
+                rel = str(Path(file_path).relative_to(self.base_path))
+            except ValueError:
+                # If can't make relative, use as-is
+                rel = file_path
+            self._rel_paths[file_path] = rel
+        return rel
+
+    def close(self) -> list[SearchMatch]:
+        """Finish parsing and return the built matches."""
+        self._flush()
+        return self.matches
+
+
 class UgrepEngine:
     """Ugrep-based search engine."""
 
@@ -62,6 +171,7 @@ class UgrepEngine:
         self._filter_security = FilterSecurity(config)
         self._filter_builder = FilterArgumentsBuilder(config)
         self._use_smart_cache = isinstance(self.cache, SmartSearchCache)
+        self._format_args_cache: tuple[frozenset[str], list[str], list[str]] | None = None
 
     async def search(
         self,
@@ -161,25 +271,25 @@ class UgrepEngine:
     ) -> SearchResult:
         """Execute the actual search (without caching)."""
         # Build command
-        cmd = self._build_command(query, path, recursive, context, fuzzy)
+        cmd = self._build_command(query, path, recursive, context, fuzzy, max_res)
         logger.debug(f"Executing: {' '.join(cmd)}")
 
+        parser = _OutputParser(self.config.knowledge.root, max_matches=max_res)
         async with self._semaphore:
             try:
-                result = await asyncio.wait_for(
-                    self._run_ugrep(cmd),
+                await asyncio.wait_for(
+                    self._run_ugrep(cmd, parser),
                     timeout=self.config.search.timeout_seconds,
                 )
             except TimeoutError as e:
                 raise search_timeout(query, self.config.search.timeout_seconds) from e
 
-        matches = self._parse_output(result.stdout, self.config.knowledge.root)
-        truncated = len(matches) > max_res
+        matches = parser.close()
 
         return SearchResult(
-            matches=matches[:max_res],
-            total_matches=len(matches),
-            truncated=truncated,
+            matches=matches,
+            total_matches=parser.total_matches,
+            truncated=parser.total_matches > max_res,
             query=query,
             searched_path=str(path),
         )
@@ -191,11 +301,16 @@ class UgrepEngine:
         recursive: bool,
         context_lines: int,
         fuzzy: bool,
+        max_results: int | None = None,
     ) -> list[str]:
         """Build ugrep command with programmatic filter arguments.
 
         Constructs command-line arguments directly instead of using .ugrep config file.
         This approach provides better transparency and cross-platform compatibility.
+
+        With ``max_results``, ugrep stops reading each file after ``max_results + 1``
+        matches and stops searching after ``max_results * 4`` matching files. One
+        match past the limit is enough to detect truncation.
         """
         cmd = [
             "ugrep",
@@ -207,27 +322,21 @@ class UgrepEngine:
         ]
 
         # Add filter arguments programmatically if needed
-        if self._filter_builder.has_filters():
-            filter_args = self._filter_builder.build_filter_args()
-            if filter_args:
-                cmd.extend(filter_args)
-                logger.debug(f"Added {len(filter_args)} filter argument(s)")
-                for arg in filter_args:
-                    logger.debug(f"  Filter: {arg}")
+        filter_args, include_args = self._format_args()
+        cmd.extend(filter_args)
 
         if fuzzy:
             cmd.append("-Z")
 
+        if max_results:
+            cmd.append(f"-m{max_results + 1}")
+
         if recursive and path.is_dir():
             cmd.append("-r")
+            if max_results:
+                cmd.append(f"--max-files={max_results * 4}")
             # Add file extension filters
-            extensions = sorted(self.config.supported_extensions)
-            if extensions:
-                for ext in extensions:
-                    # Ensure extension starts with dot
-                    if not ext.startswith("."):
-                        ext = f".{ext}"
-                    cmd.extend(["--include", f"*{ext}"])
+            cmd.extend(include_args)
 
         # Add query pattern
         cmd.append(query)
@@ -235,116 +344,76 @@ class UgrepEngine:
 
         return cmd
 
-    async def _run_ugrep(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
-        """Run ugrep in thread pool."""
-        result = await asyncio.to_thread(
-            subprocess.run,
-            cmd,
-            capture_output=True,
-            text=True,
+    def _format_args(self) -> tuple[list[str], list[str]]:
+        """Get the ugrep --filter and --include arguments for the enabled formats.
+
+        Built once and reused until the formats change; Config hands out a new
+        supported_extensions set whenever they do.
+        """
+        extensions = self.config.supported_extensions
+        cached = self._format_args_cache
+        if cached is not None and cached[0] is extensions:
+            return cached[1], cached[2]
+
+        filter_args = []
+        if self._filter_builder.has_filters():
+            filter_args = self._filter_builder.build_filter_args()
+            logger.debug(f"Built {len(filter_args)} filter argument(s)")
+            for arg in filter_args:
+                logger.debug(f"  Filter: {arg}")
+
+        include_args = []
+        for ext in sorted(extensions):
+            # Ensure extension starts with dot
+            if not ext.startswith("."):
+                ext = f".{ext}"
+            include_args.extend(["--include", f"*{ext}"])
+
+        self._format_args_cache = (extensions, filter_args, include_args)
+        return filter_args, include_args
+
+    async def _run_ugrep(self, cmd: list[str], parser: "_OutputParser") -> None:
+        """Run ugrep, parsing its output while it is still being written."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        assert proc.stdout is not None and proc.stderr is not None
+        # Drain stderr concurrently so a chatty ugrep can't block on a full pipe
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+        try:
+            pending = b""
+            while chunk := await proc.stdout.read(_READ_CHUNK_SIZE):
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    parser.feed(line.decode("utf-8", errors="replace").rstrip("\r"))
+            if pending:
+                parser.feed(pending.decode("utf-8", errors="replace").rstrip("\r"))
+            stderr = (await stderr_task).decode("utf-8", errors="replace")
+            returncode = await proc.wait()
+        finally:
+            # Timeout cancels us mid-read; don't leave ugrep running
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr_task.cancel()
+
         # Debug output
         logger.debug(f"ugrep command: {' '.join(cmd)}")
-        logger.debug(f"ugrep return code: {result.returncode}")
-        logger.debug(f"ugrep stdout length: {len(result.stdout)}")
-        logger.debug(f"ugrep stderr: {result.stderr}")
-        if result.stdout:
-            logger.debug(f"ugrep stdout preview: {result.stdout[:500]}")
+        logger.debug(f"ugrep return code: {returncode}")
+        logger.debug(f"ugrep matches: {parser.total_matches}")
+        logger.debug(f"ugrep stderr: {stderr}")
 
         # Check for errors (returncode 0 = matches found, 1 = no matches, >1 = error)
-        if result.returncode > 1:
-            stderr_output = result.stderr.strip() if result.stderr else ""
-            logger.error(f"ugrep failed with code {result.returncode}: {stderr_output}")
+        if returncode > 1:
+            stderr_output = stderr.strip()
+            logger.error(f"ugrep failed with code {returncode}: {stderr_output}")
             raise search_engine_error(
-                f"ugrep exited with code {result.returncode}",
+                f"ugrep exited with code {returncode}",
                 details=stderr_output,
             )
 
-        return result
-
-    def _parse_output(self, stdout: str, base_path: Path) -> list[SearchMatch]:
-        """Parse ugrep output into SearchMatch objects."""
-        if not stdout.strip():
-            return []
-
-        matches = []
-        current_match = None
-        context_before: list[str] = []
-
-        for line in stdout.split("\n"):
-            if not line:
-                if current_match:
-                    matches.append(current_match)
-                    current_match = None
-                    context_before = []
-                continue
-
-            # Parse line format:
-            # Match lines: filename:line_number:text
-            # Context lines: filename-line_number-text
-            # Note: On Windows, paths may contain ':' (e.g., C:\path\file.txt)
-
-            # Try to parse as a match line (uses : separator)
-            is_match_line = False
-            is_context_line = False
-
-            # Try match line first (colon separator)
-            if ":" in line:
-                # Match pattern: (path):(digits):(text)
-                # Use non-greedy match for path to handle Windows paths correctly
-                match = re.match(r"^(.+?):(\d+):(.*)$", line)
-                if match:
-                    file_path = match.group(1)
-                    line_num = match.group(2)
-                    text = match.group(3)
-                    is_match_line = True
-
-                    if current_match:
-                        matches.append(current_match)
-
-                    # Make relative to base
-                    try:
-                        rel_path = Path(file_path).relative_to(base_path)
-                        file_path = str(rel_path)
-                    except ValueError:
-                        # If can't make relative, use as-is
-                        pass
-
-                    current_match = SearchMatch(
-                        file=file_path,
-                        line_number=int(line_num),
-                        text=text,
-                        context_before=context_before.copy(),
-                        context_after=[],
-                    )
-                    context_before = []
-
-            # Try context line (dash separator)
-            if not is_match_line and "-" in line:
-                # Context lines use - instead of :
-                # Match pattern: (path)-(digits)-(text)
-                match = re.match(r"^(.+?)-(\d+)-(.*)$", line)
-                if match:
-                    text = match.group(3)
-                    is_context_line = True
-
-                    if current_match:
-                        current_match.context_after.append(text)
-                    else:
-                        context_before.append(text)
-
-            # If neither match nor context, treat as context
-            if not is_match_line and not is_context_line:
-                if current_match:
-                    current_match.context_after.append(line)
-                else:
-                    context_before.append(line)
-
-        if current_match:
-            matches.append(current_match)
-
-        return matches
-
     def _check_ug_plus_available(self) -> bool:
         """Check if ug+ command is available."""
         import shutil
@@ -9,6 +9,7 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
 from .config import Config
+from .pdf.parallel import shutdown_process_pools
 from .prompts import register_prompts
 from .resources import register_resources
 from .search.index import DocumentIndex
@@ -22,7 +23,8 @@ logger = logging.getLogger(__name__)
 class ServerContext:
     """Context holding server state and dependencies.
 
-    This encapsulates global state to enable better testing and dependency injection.
+    Each running server owns its context (local to run_server for stdio, app.state
+    for HTTP), so several servers can run in one process.
     """
 
     document_index: DocumentIndex | None = None
@@ -30,10 +32,6 @@ class ServerContext:
     config: Config | None = None
 
 
-# Global server context instance
-_server_context: ServerContext = ServerContext()
-
-
 async def create_server(config: Config) -> Server:
     """Create and configure MCP server.
 
@@ -76,22 +74,21 @@ async def create_server(config: Config) -> Server:
     return server
 
 
-async def _initialize_performance_features(config: Config) -> None:
+async def _initialize_performance_features(config: Config, context: ServerContext) -> None:
     """Initialize performance features (indexing, file watching).
 
     Args:
         config: Server configuration
+        context: Server context that receives the index and watcher
     """
-    global _server_context
-
     # Initialize document index if enabled
     if config.performance.enable_indexing:
         logger.info("Initializing document index...")
         index_path = config.knowledge.root / config.performance.index_path
-        _server_context.document_index = DocumentIndex(config.knowledge.root, index_path)
+        context.document_index = DocumentIndex(config.knowledge.root, index_path)
 
         # Try to load existing index
-        loaded = await _server_context.document_index.load_index()
+        loaded = await context.document_index.load_index()
 
         if loaded:
             logger.info("Loaded existing document index")
@@ -101,7 +98,7 @@ async def _initialize_performance_features(config: Config) -> None:
         # Rebuild index on startup if configured
         if config.performance.rebuild_index_on_startup or not loaded:
             logger.info("Building document index...")
-            result = await _server_context.document_index.build_index(
+            result = await context.document_index.build_index(
                 formats=config.performance.index_formats,
                 exclude_patterns=config.exclude.patterns,
             )
@@ -113,27 +110,25 @@ async def _initialize_performance_features(config: Config) -> None:
         # Start file watching if enabled
         if config.performance.enable_file_watching:
             logger.info("Starting file watcher for automatic index updates...")
-            _server_context.watcher_manager = WatcherManager(
-                config.knowledge.root, _server_context.document_index
-            )
-            await _server_context.watcher_manager.start(
-                watch_extensions=config.performance.index_formats
-            )
+            context.watcher_manager = WatcherManager(config.knowledge.root, context.document_index)
+            await context.watcher_manager.start(watch_extensions=config.performance.index_formats)
             logger.info("File watcher started")
 
 
-async def _cleanup_performance_features() -> None:
-    """Cleanup performance features on shutdown."""
-    global _server_context
+async def _cleanup_performance_features(context: ServerContext) -> None:
+    """Cleanup performance features on shutdown.
 
-    if _server_context.watcher_manager:
+    Args:
+        context: Server context holding the index and watcher
+    """
+    if context.watcher_manager:
         logger.info("Stopping file watcher...")
-        await _server_context.watcher_manager.stop()
+        await context.watcher_manager.stop()
 
-    if _server_context.document_index:
+    if context.document_index:
         logger.info("Saving document index...")
         try:
-            await _server_context.document_index._save_index()
+            await context.document_index._save_index()
         except Exception as e:
             logger.error(f"Failed to save index: {e}")
 
@@ -147,10 +142,11 @@ async def run_server(config: Config) -> None:
         config: Server configuration
     """
     server = await create_server(config)
+    context = ServerContext(config=config)
 
     # Initialize performance features for stdio
     if config.transport.type == "stdio":
-        await _initialize_performance_features(config)
+        await _initialize_performance_features(config, context)
 
     try:
         if config.transport.type == "stdio":
@@ -160,7 +156,10 @@ async def run_server(config: Config) -> None:
     finally:
         # Cleanup for stdio (HTTP handled by lifecycle manager)
         if config.transport.type == "stdio":
-            await _cleanup_performance_features()
+            await _cleanup_performance_features(context)
+
+        # PDF worker processes are shared by all transports
+        await asyncio.to_thread(shutdown_process_pools)
 
 
 async def _run_stdio_transport(server: Server, config: Config) -> None:
@@ -258,21 +257,3 @@ async def _run_http_transport(server: Server, config: Config) -> None:
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await task
-
-
-def get_document_index() -> DocumentIndex | None:
-    """Get the global document index instance.
-
-    Returns:
-        DocumentIndex instance if indexing is enabled, None otherwise
-    """
-    return _server_context.document_index
-
-
-def get_server_context() -> ServerContext:
-    """Get the global server context.
-
-    Returns:
-        Global ServerContext instance
-    """
-    return _server_context
@@ -2,6 +2,7 @@
 
 import fnmatch
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -100,8 +101,7 @@ async def _list_collections(config: Config, path: str) -> dict[str, Any]:
             continue
 
         if item.is_dir():
-            doc_count = _count_documents(item, config)
-            subcoll_count = sum(1 for x in item.iterdir() if x.is_dir())
+            doc_count, subcoll_count = _count_entries(item, config)
             collections.append(
                 {
                     "name": item.name,
@@ -110,7 +110,7 @@ async def _list_collections(config: Config, path: str) -> dict[str, Any]:
                     "subcollection_count": subcoll_count,
                 }
             )
-        elif item.suffix.lower() in config.supported_extensions:
+        elif config.is_supported_extension(item.suffix):
             stat = item.stat()
             documents.append(
                 {
@@ -136,7 +136,7 @@ async def _find_document(config: Config, query: str, limit: int) -> dict[str, An
     for file_path in root.rglob("*"):
         if not file_path.is_file():
             continue
-        if file_path.suffix.lower() not in config.supported_extensions:
+        if not config.is_supported_extension(file_path.suffix):
             continue
         if _should_exclude(file_path, config):
             continue
@@ -192,17 +192,28 @@ def _should_exclude(path: Path, config: Config) -> bool:
     return False
 
 
-def _count_documents(directory: Path, config: Config) -> int:
-    """Count documents in directory (non-recursive)."""
-    count = 0
-    for item in directory.iterdir():
-        if (
-            item.is_file()
-            and item.suffix.lower() in config.supported_extensions
-            and not _should_exclude(item, config)
-        ):
-            count += 1
-    return count
+def _count_entries(directory: Path, config: Config) -> tuple[int, int]:
+    """Count documents and subdirectories in directory (non-recursive).
+
+    Uses a single os.scandir pass; entry type checks come from the directory
+    listing, so only candidate documents are built into Paths.
+
+    Returns:
+        Tuple of (document count, subdirectory count)
+    """
+    documents = 0
+    subdirectories = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirectories += 1
+            elif (
+                entry.is_file()
+                and config.is_supported_extension(os.path.splitext(entry.name)[1])
+                and not _should_exclude(Path(entry.path), config)
+            ):
+                documents += 1
+    return documents, subdirectories
 
 
 def format_result(result: dict[str, Any]) -> str:
@@ -1,20 +1,43 @@
 """Read tools: read_document, get_document_info."""
 
+import codecs
+import functools
 import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent, Tool
-from pypdf import PdfReader
 
 from ..config import Config
 from ..errors import document_not_found, file_too_large, filter_execution_error, filter_timeout
 from ..pdf.parallel import ParallelPDFProcessor
 from ..security import FileAccessControl
 
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
 logger = logging.getLogger(__name__)
 
+# Parsed readers are shared between worker threads; pypdf readers are not thread-safe
+_pdf_lock = threading.Lock()
+
+# PDFium is not thread-safe at all: pypdfium2 forbids concurrent calls from
+# different threads, even on different documents
+_pdfium_lock = threading.Lock()
+
+# Parsed PDF readers by (path, mtime_ns, size), least recently used first. A
+# PdfReader keeps the whole file in memory, so the cache is bounded by the
+# total file size as well as by count; larger files are never cached.
+_PDF_CACHE_MAX_ENTRIES = 32
+_PDF_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_pdf_cache: OrderedDict[tuple[str, int, int], "PdfReader"] = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
 
 def get_read_tools() -> list[Tool]:
     """Get read tool definitions."""
@@ -260,24 +283,23 @@ async def _read_document(config: Config, args: dict[str, Any]) -> dict[str, Any]
 
     # === PDF: Special handling with parallel processing ===
     if ext == ".pdf":
-        if config.performance.enable_parallel_pdf:
+        # PDFium extracts natively and is not thread-safe, so it skips the pypdf pool
+        # (enable_parallel_pdf and max_pdf_workers do not apply) and reads one PDF at a time
+        if config.performance.enable_parallel_pdf and _pdfium() is None:
             processor = ParallelPDFProcessor(max_workers=config.performance.max_pdf_workers)
             try:
-                content = await processor.extract_text_parallel(
-                    full_path, pages=pages if pages else None, include_page_markers=True
+                content, total_pages, pages_read = await processor.extract_pages_parallel(
+                    full_path,
+                    pages=pages if pages else None,
+                    include_page_markers=True,
+                    max_chars=config.limits.max_document_read_chars,
                 )
-                reader = PdfReader(full_path)
-                total_pages = len(reader.pages)
-
-                # Determine which pages were read
-                if pages:
-                    pages_read = [p for p in pages if 0 < p <= total_pages]
-                else:
-                    pages_read = list(range(1, total_pages + 1))
             finally:
                 processor.shutdown()
         else:
-            content, total_pages, pages_read = await asyncio.to_thread(_read_pdf, full_path, pages)
+            content, total_pages, pages_read = await asyncio.to_thread(
+                _read_pdf, full_path, pages, config.limits.max_document_read_chars
+            )
 
     # === Filtered formats: Use filter command ===
     elif filter_cmd:
@@ -293,7 +315,9 @@ async def _read_document(config: Config, args: dict[str, Any]) -> dict[str, Any]
 
     # === Plain text formats: Direct read ===
     else:
-        content = await asyncio.to_thread(full_path.read_text, encoding="utf-8", errors="replace")
+        content = await asyncio.to_thread(
+            _read_text_capped, full_path, config.limits.max_document_read_chars
+        )
         total_pages = 1
         pages_read = [1]
 
@@ -311,25 +335,146 @@ async def _read_document(config: Config, args: dict[str, Any]) -> dict[str, Any]
     }
 
 
-def _read_pdf(path: Path, pages: list[int]) -> tuple[str, int, list[int]]:
-    """Read PDF content."""
-    reader = PdfReader(path)
-    total_pages = len(reader.pages)
+def _read_text_capped(path: Path, max_chars: int) -> str:
+    """Read a UTF-8 text file, stopping once more than max_chars are certain.
+
+    At most 4 bytes make up one character, so ``max_chars * 4`` bytes always
+    decode to more than ``max_chars`` characters and truncation is still detected
+    without reading the rest of a large file. Newlines are translated like
+    ``Path.read_text``.
+    """
+    limit = max_chars * 4 + 1024
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        remaining = limit
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+
+    # A capped read may end mid-character; only decode the tail at end of file
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    text = decoder.decode(b"".join(chunks), final=remaining > 0)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_pdf(
+    path: Path, pages: list[int], max_chars: int | None = None
+) -> tuple[str, int, list[int]]:
+    """Read PDF content, using PDFium when pypdfium2 is installed.
+
+    With ``max_chars``, extraction stops at the first page that takes the text past
+    the limit, so only the pages actually read are returned in ``pages_read``.
+    """
+    if _pdfium() is not None:
+        return _read_pdf_pdfium(path, pages, max_chars)
+
+    reader = _open_pdf(path)
+    with _pdf_lock:
+        total_pages = len(reader.pages)
+        page_indices = _page_indices(pages, total_pages)
+        content, pages_read = _collect_pages(
+            page_indices, lambda idx: reader.pages[idx].extract_text() or "", max_chars
+        )
+
+    return content, total_pages, pages_read
 
-    # Determine which pages to read
+
+def _page_indices(pages: list[int], total_pages: int) -> list[int]:
+    """Convert requested 1-indexed pages to valid 0-indexed ones; empty = all."""
     if pages:
-        # Convert to 0-indexed, filter valid
-        page_indices = [p - 1 for p in pages if 0 < p <= total_pages]
-    else:
-        page_indices = list(range(total_pages))
+        return [p - 1 for p in pages if 0 < p <= total_pages]
+    return list(range(total_pages))
+
 
-    text_parts = []
+def _collect_pages(
+    page_indices: list[int], extract: Callable[[int], str], max_chars: int | None
+) -> tuple[str, list[int]]:
+    """Join page texts under "--- Page N ---" markers, stopping past max_chars."""
+    text_parts: list[str] = []
+    pages_read = []
+    length = -1  # Length of the joined text: one "\n" fewer than parts
     for idx in page_indices:
-        page_num = idx + 1
-        text_parts.append(f"--- Page {page_num} ---")
-        text_parts.append(reader.pages[idx].extract_text() or "")
+        marker = f"--- Page {idx + 1} ---"
+        text = extract(idx)
+        text_parts += (marker, text)
+        pages_read.append(idx + 1)
+        length += len(marker) + len(text) + 2
+        if max_chars is not None and length > max_chars:
+            break
+
+    return "\n".join(text_parts), pages_read
+
+
+@functools.cache
+def _pdfium() -> Any:
+    """Get pypdfium2 if installed; imported on first PDF read to keep startup fast."""
+    try:
+        import pypdfium2
+    except ImportError:  # optional: pypdf is used for text extraction when PDFium is absent
+        return None
+    return pypdfium2
+
+
+def _open_pdf(path: Path) -> "PdfReader":
+    """Get a parsed PDF, reusing the cached reader while the file is unchanged."""
+    from pypdf import PdfReader
+
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)  # a modified file gets a new key
+    with _pdf_cache_lock:
+        reader = _pdf_cache.get(key)
+        if reader is not None:
+            _pdf_cache.move_to_end(key)
+            return reader
+
+    reader = PdfReader(key[0])
+    if stat.st_size <= _PDF_CACHE_MAX_BYTES:
+        with _pdf_cache_lock:
+            _pdf_cache[key] = reader
+            cached_bytes = sum(size for _, _, size in _pdf_cache)
+            while len(_pdf_cache) > _PDF_CACHE_MAX_ENTRIES or cached_bytes > _PDF_CACHE_MAX_BYTES:
+                (_, _, size), _ = _pdf_cache.popitem(last=False)
+                cached_bytes -= size
+    return reader
+
+
+def _read_pdf_pdfium(
+    path: Path, pages: list[int], max_chars: int | None = None
+) -> tuple[str, int, list[int]]:
+    """Read PDF content with PDFium's native text extractor.
+
+    Holds ``_pdfium_lock`` from opening to closing the document, so concurrent
+    reads never call into PDFium from two threads at once.
+    """
+
+    def extract(idx: int) -> str:
+        page = pdf[idx]
+        textpage = page.get_textpage()
+        text: str = textpage.get_text_range()
+        textpage.close()
+        page.close()
+        # PDFium separates lines with CRLF; match pypdf's output
+        return text.replace("\r\n", "\n")
+
+    with _pdfium_lock:
+        pdf = _pdfium().PdfDocument(path)
+        try:
+            total_pages = len(pdf)
+            content, pages_read = _collect_pages(
+                _page_indices(pages, total_pages), extract, max_chars
+            )
+        finally:
+            pdf.close()
 
-    return "\n".join(text_parts), total_pages, [i + 1 for i in page_indices]
+    return content, total_pages, pages_read
 
 
 async def _get_document_info(config: Config, args: dict[str, Any]) -> dict[str, Any]:
@@ -407,8 +552,13 @@ async def _get_document_info(config: Config, args: dict[str, Any]) -> dict[str,
 
 def _extract_pdf_info(path: Path) -> dict[str, Any]:
     """Extract PDF metadata and TOC."""
-    reader = PdfReader(path)
+    reader = _open_pdf(path)
+    with _pdf_lock:
+        return _extract_reader_info(reader)
+
 
+def _extract_reader_info(reader: "PdfReader") -> dict[str, Any]:
+    """Extract metadata and TOC from a parsed PDF."""
     info: dict[str, Any] = {
         "pages": len(reader.pages),
         "has_toc": False,
@@ -433,7 +583,7 @@ def _extract_pdf_info(path: Path) -> dict[str, Any]:
     return info
 
 
-def _parse_outlines(reader: PdfReader, outlines: Any, depth: int = 0) -> list[dict[str, Any]]:
+def _parse_outlines(reader: "PdfReader", outlines: Any, depth: int = 0) -> list[dict[str, Any]]:
     """Recursively parse PDF outlines into TOC structure."""
     if depth > 5:  # Limit depth
         return []
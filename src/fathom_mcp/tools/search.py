@@ -240,7 +240,9 @@ async def _search_multiple(
         elif isinstance(result, SearchResult):
             result_dict[term] = {
                 "found": result.total_matches > 0,
+                # A lower bound when truncated: ugrep stops past the per-term limit
                 "match_count": result.total_matches,
+                "truncated": result.truncated,
                 "excerpts": [
                     {
                         "text": m.text,
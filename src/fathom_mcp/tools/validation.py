@@ -22,6 +22,8 @@ async def validate_filter_tools(config: Config) -> dict[str, bool]:
         Dict mapping format name to availability status
     """
     results = {}
+    probes = {}
+    filter_security = FilterSecurity(config)
 
     for fmt_name, fmt_config in config.formats.items():
         if not fmt_config.enabled or not fmt_config.filter:
@@ -42,34 +44,34 @@ async def validate_filter_tools(config: Config) -> dict[str, bool]:
             fmt_config.enabled = False
             continue
 
-        # Test tool works with simple input
-        try:
-            # Skip validation for PDF - uses pypdf library directly, not pdftotext filter
-            # pdftotext is only used by ugrep for search, not for reading
-            if fmt_name == "pdf":
-                results[fmt_name] = True
-                logger.debug("Skipping filter validation for 'pdf' (uses pypdf library)")
-                continue
-
-            filter_security = FilterSecurity(config)
-            test_input = b"test"
-            filter_cmd_stdin = config.prepare_filter_for_stdin(fmt_config.filter)
-
-            await asyncio.wait_for(
-                filter_security.run_secure_filter(
-                    filter_cmd_stdin,
-                    test_input,
-                ),
-                timeout=5,
-            )
+        # Skip validation for PDF - uses pypdf library directly, not pdftotext filter
+        # pdftotext is only used by ugrep for search, not for reading
+        if fmt_name == "pdf":
             results[fmt_name] = True
-            logger.debug(f"Filter tool '{tool_name}' for format '{fmt_name}' validated")
+            logger.debug("Skipping filter validation for 'pdf' (uses pypdf library)")
+            continue
 
-        except Exception as e:
+        # Test tool works with simple input; probes run concurrently below
+        results[fmt_name] = False
+        filter_cmd_stdin = config.prepare_filter_for_stdin(fmt_config.filter)
+        probes[fmt_name] = asyncio.wait_for(
+            filter_security.run_secure_filter(filter_cmd_stdin, b"test"),
+            timeout=5,
+        )
+
+    outcomes = await asyncio.gather(*probes.values(), return_exceptions=True)
+    for fmt_name, outcome in zip(probes, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
             logger.warning(
-                f"Filter tool test failed for '{fmt_name}': {e}. Disabling {fmt_name} support."
+                f"Filter tool test failed for '{fmt_name}': {outcome}. "
+                f"Disabling {fmt_name} support."
             )
-            fmt_config.enabled = False
-            results[fmt_name] = False
+            config.formats[fmt_name].enabled = False
+            continue
+
+        results[fmt_name] = True
+        logger.debug(f"Filter tool for format '{fmt_name}' validated")
 
+    # Formats may have been disabled above
+    config.invalidate_format_cache()
     return results
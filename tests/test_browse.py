@@ -49,3 +49,17 @@ async def test_find_document_multiple_matches(config):
     # Should find Guide.md
     names = [m["name"] for m in result["matches"]]
     assert "Guide.md" in names
+
+
+@pytest.mark.asyncio
+async def test_list_collections_counts(config):
+    root = config.knowledge.root
+    (root / "games" / "notes.xyz").write_text("unsupported")
+    (root / "games" / ".hidden.md").write_text("hidden")
+
+    result = await _list_collections(config, "")
+    games = next(c for c in result["collections"] if c["name"] == "games")
+
+    # Only Guide.md counts; unsupported and hidden files are skipped
+    assert games["document_count"] == 1
+    assert games["subcollection_count"] == 1
@@ -11,7 +11,7 @@ from fathom_mcp.__main__ import main
 
 def test_main_requires_ugrep():
     """Test that main exits if ugrep is not installed."""
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=False):
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=False):
         with pytest.raises(SystemExit) as exc_info:
             with patch.object(sys, "argv", ["fathom-mcp", "--root", "/tmp"]):
                 main()
@@ -23,8 +23,8 @@ def test_main_with_invalid_config():
     """Test that main exits with error for invalid config."""
     from fathom_mcp.config import ConfigError
 
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True):
-        with patch("fathom_mcp.__main__.load_config", side_effect=ConfigError("Config error")):
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True):
+        with patch("fathom_mcp.config.load_config", side_effect=ConfigError("Config error")):
             with pytest.raises(SystemExit) as exc_info:
                 with patch.object(sys, "argv", ["fathom-mcp", "--config", "invalid.yaml"]):
                     main()
@@ -34,8 +34,8 @@ def test_main_with_invalid_config():
 
 def test_main_with_root_argument(temp_knowledge_dir):
     """Test main with --root argument."""
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True):
-        with patch("fathom_mcp.__main__.run_server", new_callable=AsyncMock):
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True):
+        with patch("fathom_mcp.server.run_server", new_callable=AsyncMock):
             with patch("fathom_mcp.__main__.asyncio.run") as mock_asyncio_run:
                 with patch.object(sys, "argv", ["fathom-mcp", "--root", str(temp_knowledge_dir)]):
                     main()
@@ -55,8 +55,8 @@ knowledge:
 """
     )
 
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True):
-        with patch("fathom_mcp.__main__.run_server", new_callable=AsyncMock):
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True):
+        with patch("fathom_mcp.server.run_server", new_callable=AsyncMock):
             with patch("fathom_mcp.__main__.asyncio.run") as mock_asyncio_run:
                 with patch.object(sys, "argv", ["fathom-mcp", "--config", str(config_file)]):
                     main()
@@ -68,8 +68,8 @@ def test_main_with_log_level_argument(temp_knowledge_dir):
     """Test main with --log-level argument."""
     import logging
 
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True):
-        with patch("fathom_mcp.__main__.run_server", new_callable=AsyncMock):
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True):
+        with patch("fathom_mcp.server.run_server", new_callable=AsyncMock):
             with patch("fathom_mcp.__main__.asyncio.run"):
                 with patch("fathom_mcp.__main__.logging.basicConfig") as mock_logging:
                     with patch.object(
@@ -88,7 +88,7 @@ def test_main_with_log_level_argument(temp_knowledge_dir):
 def test_main_handles_keyboard_interrupt(temp_knowledge_dir):
     """Test that main handles KeyboardInterrupt gracefully."""
     with (
-        patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True),
+        patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True),
         patch("fathom_mcp.__main__.asyncio.run", side_effect=KeyboardInterrupt) as mock_asyncio_run,
     ):
         # Should not raise, just exit gracefully
@@ -112,8 +112,8 @@ knowledge:
 """
     )
 
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True):
-        with patch("fathom_mcp.__main__.run_server", new_callable=AsyncMock) as mock_run:
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True):
+        with patch("fathom_mcp.server.run_server", new_callable=AsyncMock) as mock_run:
             with (
                 patch("fathom_mcp.__main__.asyncio.run"),
                 patch.object(
@@ -138,8 +138,8 @@ knowledge:
 
 def test_main_creates_minimal_config_with_root_only(temp_knowledge_dir):
     """Test that main creates minimal config when only --root is provided."""
-    with patch("fathom_mcp.__main__.check_ugrep_installed", return_value=True):
-        with patch("fathom_mcp.__main__.run_server", new_callable=AsyncMock) as mock_run:
+    with patch("fathom_mcp.search.ugrep.check_ugrep_installed", return_value=True):
+        with patch("fathom_mcp.server.run_server", new_callable=AsyncMock) as mock_run:
             with patch("fathom_mcp.__main__.asyncio.run"):
                 with patch.object(sys, "argv", ["fathom-mcp", "--root", str(temp_knowledge_dir)]):
                     main()
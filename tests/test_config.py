@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from fathom_mcp.config import Config, ConfigError, KnowledgeConfig, load_config
+from fathom_mcp.config import Config, ConfigError, FormatConfig, KnowledgeConfig, load_config
 
 
 def test_knowledge_config_validation():
@@ -88,6 +88,46 @@ def test_load_config_file_not_found():
         load_config("/nonexistent/config.yaml")
 
 
+def test_load_config_defaults_from_env(tmp_path, monkeypatch):
+    """Test file-less config is reused but each caller gets its own copy."""
+    first_root = tmp_path / "first"
+    second_root = tmp_path / "second"
+    first_root.mkdir()
+    second_root.mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FMCP_KNOWLEDGE__ROOT", str(first_root))
+
+    config = load_config()
+    assert config.knowledge.root == first_root
+
+    # Mutating a returned config must not leak into the next one
+    config.knowledge.root = second_root
+    config.formats["word_docx"].enabled = True
+    again = load_config()
+    assert again.knowledge.root == first_root
+    assert ".docx" not in again.supported_extensions
+
+    # Changing the environment rebuilds the defaults
+    monkeypatch.setenv("FMCP_KNOWLEDGE__ROOT", str(second_root))
+    assert load_config().knowledge.root == second_root
+
+
+def test_server_import_defers_heavy_modules():
+    """Test that YAML and PDF libraries load on first use, not at server import."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, fathom_mcp.server; "
+        "print(sorted(m for m in ('yaml', 'pypdf', 'pypdfium2') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
 def test_needs_document_filters():
     """Test checking if document filters are needed."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -99,16 +139,19 @@ def test_needs_document_filters():
         # Disable all formats first
         for fmt in config.formats.values():
             fmt.enabled = False
+        config.invalidate_format_cache()
 
         # No filters needed
         assert not config.needs_document_filters()
 
         # Enable format without filter (CSV)
         config.formats["csv"].enabled = True
+        config.invalidate_format_cache()
         assert not config.needs_document_filters()
 
         # Enable format with filter (DOCX)
         config.formats["word_docx"].enabled = True
+        config.invalidate_format_cache()
         assert config.needs_document_filters()
 
 
@@ -127,12 +170,38 @@ def test_get_filter_for_extension_with_and_without_dot():
 
         # Test disabled format
         config.formats["word_docx"].enabled = False
+        config.invalidate_format_cache()
         assert config.get_filter_for_extension(".docx") is None
 
         # Test unknown extension
         assert config.get_filter_for_extension(".xyz") is None
 
 
+def test_supported_extensions_track_format_changes():
+    """Test extension lookup is cached and refreshed after format changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(knowledge=KnowledgeConfig(root=tmpdir))
+        extensions = config.supported_extensions
+        assert ".docx" not in extensions
+        assert config.supported_extensions is extensions
+
+        config.formats["word_docx"].enabled = True
+        config.invalidate_format_cache()
+        assert ".docx" in config.supported_extensions
+
+        config.formats["pdf"] = FormatConfig(extensions=[".PDF"], filter="mutool draw %")
+        config.invalidate_format_cache()
+        assert config.get_filter_for_extension(".pdf") == "mutool draw %"
+
+        config.formats["markdown"].extensions.append(".mdx")
+        config.invalidate_format_cache()
+        assert ".mdx" in config.supported_extensions
+
+        # A new formats dict is picked up without invalidating
+        config.formats = {"text": FormatConfig(extensions=[".txt"])}
+        assert config.supported_extensions == frozenset({".txt"})
+
+
 def test_prepare_filter_for_stdin():
     """Test filter placeholder replacement."""
     with tempfile.TemporaryDirectory() as tmpdir:
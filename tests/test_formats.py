@@ -1,6 +1,7 @@
 """Tests for multi-format document support."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -111,13 +112,16 @@ async def test_multi_format_search_mock(tmp_path):
     engine = UgrepEngine(config)
 
     # Mock the subprocess execution
-    with patch("asyncio.to_thread") as mock_to_thread:
-        # Mock process result
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "test.docx:10:Found match in DOCX\n"
-        mock_result.stderr = ""
-        mock_to_thread.return_value = mock_result
+    with patch("asyncio.create_subprocess_exec") as mock_exec:
+        # Mock process streaming its output
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(b"test.docx:10:Found match in DOCX\n")
+        stdout.feed_eof()
+        stderr = asyncio.StreamReader()
+        stderr.feed_eof()
+        mock_proc = MagicMock(stdout=stdout, stderr=stderr, returncode=0)
+        mock_proc.wait = AsyncMock(return_value=0)
+        mock_exec.return_value = mock_proc
 
         # Run search
         results = await engine.search(
@@ -126,11 +130,10 @@ async def test_multi_format_search_mock(tmp_path):
             recursive=True,
         )
 
-        # Verify ugrep was called with config
-        call_args = mock_to_thread.call_args[0]
-        # First arg is the function (subprocess.run), second is the command list
+        # Verify ugrep was called with the command list as positional args
+        call_args = mock_exec.call_args[0]
+        assert call_args[0] == "ugrep"
         assert len(call_args) >= 2
-        # The command should be in the kwargs or args
         # Verify the result was parsed
         assert results.total_matches >= 0
 
@@ -210,8 +213,9 @@ async def test_supported_extensions_includes_new_formats(tmp_path):
     # Should include .docx now
     assert ".docx" in extensions
 
-    # Disable it
+    # Disable it (in-place edits need an explicit cache refresh)
     config.formats["word_docx"].enabled = False
+    config.invalidate_format_cache()
 
     extensions = config.supported_extensions
 
@@ -161,6 +161,115 @@ class TestParallelProcessing:
         assert isinstance(text, str)
         processor.shutdown()
 
+    async def test_small_read_parses_pdf_once(self, tmp_path, monkeypatch):
+        """Test that reads below the threshold reuse one reader for all pages."""
+        from fathom_mcp.pdf import parallel
+
+        writer = PdfWriter()
+        for _i in range(6):
+            writer.add_blank_page(width=612, height=792)
+
+        pdf_path = tmp_path / "small.pdf"
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+
+        opened = []
+        open_reader = parallel._open_reader
+        monkeypatch.setattr(
+            parallel, "_open_reader", lambda path: opened.append(path) or open_reader(path)
+        )
+
+        processor = ParallelPDFProcessor(max_workers=4)
+        text = await processor.extract_text_parallel(pdf_path)
+        processor.shutdown()
+
+        assert len(opened) == 1
+        markers = [line for line in text.splitlines() if line.startswith("--- Page")]
+        assert markers == [f"--- Page {i} ---" for i in range(1, 7)]
+
+    async def test_large_read_uses_process_pool(self, tmp_path):
+        """Test that reads above the threshold keep page order across worker processes."""
+        from fathom_mcp.pdf.parallel import PROCESS_POOL_MIN_PAGES
+
+        writer = PdfWriter()
+        for _i in range(PROCESS_POOL_MIN_PAGES + 4):
+            writer.add_blank_page(width=612, height=792)
+
+        pdf_path = tmp_path / "large.pdf"
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+
+        processor = ParallelPDFProcessor(max_workers=2)
+        text = await processor.extract_text_parallel(pdf_path)
+        processor.shutdown()
+
+        markers = [line for line in text.splitlines() if line.startswith("--- Page")]
+        assert markers == [f"--- Page {i} ---" for i in range(1, PROCESS_POOL_MIN_PAGES + 5)]
+
+    async def test_extract_pages_stops_past_max_chars(self, tmp_path):
+        """Test that capped reads stop extracting pages soon after the limit."""
+        from fathom_mcp.pdf.parallel import PROCESS_POOL_MIN_PAGES
+
+        writer = PdfWriter()
+        for _i in range(3 * PROCESS_POOL_MIN_PAGES):
+            writer.add_blank_page(width=612, height=792)
+
+        pdf_path = tmp_path / "capped.pdf"
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+
+        processor = ParallelPDFProcessor(max_workers=2)
+        # Small read: stops at the first page past the limit
+        text, total_pages, pages_read = await processor.extract_pages_parallel(
+            pdf_path, pages=[1, 2, 3, 4], max_chars=20
+        )
+        assert total_pages == 3 * PROCESS_POOL_MIN_PAGES
+        assert pages_read == [1, 2]
+        assert text == "--- Page 1 ---\n\n--- Page 2 ---\n"
+
+        # Large read: stops after the first wave of worker chunks
+        text, _, pages_read = await processor.extract_pages_parallel(pdf_path, max_chars=20)
+        processor.shutdown()
+        assert pages_read == list(range(1, 2 * PROCESS_POOL_MIN_PAGES + 1))
+        assert text.count("--- Page") == 2 * PROCESS_POOL_MIN_PAGES
+
+    async def test_large_read_recovers_from_broken_process_pool(self, tmp_path):
+        """Test that a dead worker process does not break later large reads."""
+        import os
+        from concurrent.futures.process import BrokenProcessPool
+
+        from fathom_mcp.pdf.parallel import PROCESS_POOL_MIN_PAGES, _process_pool
+
+        writer = PdfWriter()
+        for _i in range(PROCESS_POOL_MIN_PAGES + 4):
+            writer.add_blank_page(width=612, height=792)
+
+        pdf_path = tmp_path / "large.pdf"
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+
+        # Kill a worker, as a crash or OOM kill would
+        broken = _process_pool(2)
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+
+        processor = ParallelPDFProcessor(max_workers=2)
+        text = await processor.extract_text_parallel(pdf_path)
+        processor.shutdown()
+
+        assert _process_pool(2) is not broken
+        assert text.count("--- Page") == PROCESS_POOL_MIN_PAGES + 4
+
+    def test_shutdown_process_pools(self):
+        """Test that shutdown drops the shared pools."""
+        from fathom_mcp.pdf.parallel import _process_pool, shutdown_process_pools
+
+        pool = _process_pool(2)
+        shutdown_process_pools()
+
+        assert _process_pool(2) is not pool
+        shutdown_process_pools()
+
     async def test_chunk_extraction(self, pdf_processor, sample_pdf):
         """Test that chunk extraction works correctly."""
         from pypdf import PdfReader
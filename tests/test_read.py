@@ -25,7 +25,7 @@ async def test_read_document_not_found(config):
     with pytest.raises(McpError) as exc_info:
         await _read_document(config, {"path": "nonexistent.md", "pages": []})
 
-    assert exc_info.value.code.value == "1002"  # DOCUMENT_NOT_FOUND
+    assert exc_info.value.code == "1002"  # DOCUMENT_NOT_FOUND
 
 
 @pytest.mark.asyncio
@@ -43,6 +43,95 @@ async def test_read_document_truncation(config):
     assert "(truncated)" in result["content"]
 
 
+def test_read_text_capped_matches_read_text(tmp_path):
+    """Test capped reads decode and translate newlines like Path.read_text."""
+    from fathom_mcp.tools.read import _read_text_capped
+
+    text_file = tmp_path / "notes.txt"
+    text_file.write_bytes("héllo ✓\r\nwörld\r".encode() * 1000)
+    expected = text_file.read_text(encoding="utf-8", errors="replace")
+
+    assert _read_text_capped(text_file, 100_000) == expected
+
+    capped = _read_text_capped(text_file, 50)
+    assert len(capped) > 50
+    assert capped[:50] == expected[:50]
+
+
+@pytest.mark.asyncio
+async def test_read_document_pdf_stops_at_char_limit(config):
+    """Test PDF extraction stops at the page that crosses the character limit."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for _i in range(80):
+        writer.add_blank_page(width=612, height=792)
+    with open(config.knowledge.root / "book.pdf", "wb") as f:
+        writer.write(f)
+
+    config.performance.enable_parallel_pdf = False
+    config.limits.max_document_read_chars = 1000
+
+    result = await _read_document(config, {"path": "book.pdf", "pages": []})
+
+    assert result["truncated"]
+    assert result["total_pages"] == 80
+    # Blank pages only add their markers, so the limit is crossed well before page 80
+    pages_read = result["pages_read"]
+    assert pages_read == list(range(1, len(pages_read) + 1))
+    assert 1 < len(pages_read) < 80
+    assert f"--- Page {len(pages_read) + 1} ---" not in result["content"]
+    assert result["content"].startswith("--- Page 1 ---")
+
+
+@pytest.mark.asyncio
+async def test_read_document_pdfium_serializes_concurrent_reads(config, monkeypatch):
+    """Test concurrent PDFium reads never overlap and match a single read."""
+    pytest.importorskip("pypdfium2")
+    import asyncio
+    import threading
+    import time
+
+    from pypdf import PdfWriter
+
+    from fathom_mcp.tools import read
+
+    writer = PdfWriter()
+    for _i in range(3):
+        writer.add_blank_page(width=612, height=792)
+    with open(config.knowledge.root / "manual.pdf", "wb") as f:
+        writer.write(f)
+
+    active = 0
+    max_active = 0
+    counter_lock = threading.Lock()
+    collect_pages = read._collect_pages
+
+    def tracking_collect_pages(*args):
+        nonlocal active, max_active
+        with counter_lock:
+            active += 1
+            max_active = max(max_active, active)
+        try:
+            time.sleep(0.01)
+            return collect_pages(*args)
+        finally:
+            with counter_lock:
+                active -= 1
+
+    monkeypatch.setattr(read, "_collect_pages", tracking_collect_pages)
+
+    expected = await _read_document(config, {"path": "manual.pdf", "pages": []})
+    results = await asyncio.gather(
+        *(_read_document(config, {"path": "manual.pdf", "pages": []}) for _ in range(8))
+    )
+
+    assert expected["total_pages"] == 3
+    assert expected["content"].count("--- Page") == 3
+    assert all(result == expected for result in results)
+    assert max_active == 1
+
+
 # ============================================================================
 # Document Info Tests (get_document_info)
 # ============================================================================
@@ -127,6 +216,65 @@ async def test_get_document_info_pdf_without_toc(rich_knowledge_dir, rich_config
     assert result["toc"] is None
 
 
+def test_open_pdf_reuses_reader_until_file_changes(rich_knowledge_dir):
+    """Test that parsed PDFs are cached and re-parsed after modification."""
+    import os
+
+    from pypdf import PdfWriter
+
+    from fathom_mcp.tools.read import _open_pdf
+
+    pdf_path = rich_knowledge_dir / "games" / "cached.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    reader = _open_pdf(pdf_path)
+    assert _open_pdf(pdf_path) is reader
+
+    writer.add_blank_page(width=612, height=792)
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+    stat = pdf_path.stat()
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    updated = _open_pdf(pdf_path)
+    assert updated is not reader
+    assert len(updated.pages) == 2
+
+
+def test_open_pdf_cache_is_bounded_by_file_size(rich_knowledge_dir, monkeypatch):
+    """Test that cached readers are evicted by total size and big files skip the cache."""
+    from pypdf import PdfWriter
+
+    from fathom_mcp.tools import read
+
+    paths = []
+    for name in ("a", "b", "c"):
+        pdf_path = rich_knowledge_dir / "games" / f"{name}.pdf"
+        writer = PdfWriter()
+        writer.add_blank_page(width=612, height=792)
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+        paths.append(pdf_path)
+
+    size = paths[0].stat().st_size
+    monkeypatch.setattr(read, "_pdf_cache", read.OrderedDict())
+    monkeypatch.setattr(read, "_PDF_CACHE_MAX_BYTES", 2 * size)
+
+    first = read._open_pdf(paths[0])
+    read._open_pdf(paths[1])
+    read._open_pdf(paths[2])
+    assert len(read._pdf_cache) == 2
+    assert read._open_pdf(paths[0]) is not first  # evicted as least recently used
+
+    monkeypatch.setattr(read, "_PDF_CACHE_MAX_BYTES", size - 1)
+    read._pdf_cache.clear()
+    assert read._open_pdf(paths[0]) is not read._open_pdf(paths[0])
+    assert not read._pdf_cache
+
+
 @pytest.mark.asyncio
 async def test_get_document_info_nested_toc(rich_knowledge_dir, rich_config):
     """Test get_document_info with nested table of contents."""
@@ -1,6 +1,7 @@
 """Tests for MCP resources functionality."""
 
 import json
+import os
 import sys
 
 import pytest
@@ -102,6 +103,30 @@ async def test_resources_filters_hidden_files(rich_knowledge_dir, rich_config):
     assert ".hidden_dir" not in item_names
 
 
+@pytest.mark.asyncio
+async def test_resources_collection_index_cached_by_mtime(rich_knowledge_dir, rich_config):
+    """Test collection index is reused until the directory mtime changes."""
+    games = rich_knowledge_dir / "games"
+    os.utime(games, ns=(1_000_000_000, 1_000_000_000))
+
+    first = await _get_collection_index(rich_config, "games")
+    assert await _get_collection_index(rich_config, "games") is first
+
+    # Adding a document updates the directory mtime
+    (games / "Expansion.md").write_text("# Expansion")
+    result = json.loads(await _get_collection_index(rich_config, "games"))
+    assert "Expansion.md" in [item["name"] for item in result["items"]]
+
+    # Enabling a format changes the output even with an unchanged mtime
+    (games / "Manual.docx").write_bytes(b"")
+    os.utime(games, ns=(1_000_000_000, 1_000_000_000))
+    await _get_collection_index(rich_config, "games")
+    rich_config.formats["word_docx"].enabled = True
+    rich_config.invalidate_format_cache()
+    result = json.loads(await _get_collection_index(rich_config, "games"))
+    assert "Manual.docx" in [item["name"] for item in result["items"]]
+
+
 # ============================================================================
 # Security Tests - Path Traversal Prevention
 # ============================================================================
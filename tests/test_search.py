@@ -2,18 +2,29 @@
 
 import asyncio
 import logging
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from fathom_mcp.errors import ErrorCode, McpError
-from fathom_mcp.search.ugrep import SearchResult, UgrepEngine
+from fathom_mcp.search.ugrep import SearchResult, UgrepEngine, _OutputParser
 from fathom_mcp.tools.search import _search_documents, _search_multiple
 
 # Enable debug logging for tests
 logging.basicConfig(level=logging.DEBUG, format="%(name)s - %(levelname)s - %(message)s")
 
+UG_AVAILABLE = shutil.which("ug") is not None or shutil.which("ugrep") is not None
+
+
+def _parse_output(stdout, base_path):
+    """Feed ugrep output through _OutputParser line by line."""
+    parser = _OutputParser(base_path)
+    for line in stdout.split("\n"):
+        parser.feed(line)
+    return parser.close()
+
 
 # ============================================================================
 # Fixtures for search tests
@@ -571,9 +582,8 @@ async def test_search_special_characters(search_engine, rich_knowledge_dir):
     assert isinstance(result, SearchResult)
 
 
-@pytest.mark.asyncio
-async def test_parse_output_with_context(search_engine):
-    """Test _parse_output method with context lines."""
+def test_parse_output_with_context():
+    """Test _OutputParser with context lines."""
     # Simulate ugrep output with context
     stdout = """games/test.md:5:This is a match
 games/test.md-6-Context after line 1
@@ -583,7 +593,7 @@ games/other.md:10:Another match
 """
 
     base_path = Path("/tmp/knowledge")
-    matches = search_engine._parse_output(stdout, base_path)
+    matches = _parse_output(stdout, base_path)
 
     assert len(matches) >= 1
     if len(matches) > 0:
@@ -592,17 +602,28 @@ games/other.md:10:Another match
         assert "match" in first_match.text.lower()
 
 
-@pytest.mark.asyncio
-async def test_parse_output_empty(search_engine):
-    """Test _parse_output with empty output."""
+def test_parse_output_empty():
+    """Test _OutputParser with empty output."""
     stdout = ""
     base_path = Path("/tmp/knowledge")
 
-    matches = search_engine._parse_output(stdout, base_path)
+    matches = _parse_output(stdout, base_path)
 
     assert len(matches) == 0
 
 
+def test_parse_output_dashed_date_path():
+    """Test match lines are recognized when the path contains -digits- parts."""
+    stdout = "/tmp/knowledge/notes-2024-01.md:5:attack roll\n"
+
+    matches = _parse_output(stdout, Path("/tmp/knowledge"))
+
+    assert len(matches) == 1
+    assert matches[0].file == "notes-2024-01.md"
+    assert matches[0].line_number == 5
+    assert matches[0].text == "attack roll"
+
+
 @pytest.mark.asyncio
 async def test_build_command_recursive(search_engine, rich_knowledge_dir):
     """Test _build_command for recursive search."""
@@ -636,6 +657,59 @@ async def test_build_command_fuzzy(search_engine, rich_knowledge_dir):
     assert "-Z" in cmd  # Fuzzy flag
 
 
+@pytest.mark.asyncio
+async def test_build_command_max_results(search_engine, rich_knowledge_dir):
+    """Test _build_command pushes the result limit down to ugrep."""
+    cmd = search_engine._build_command(
+        query="test",
+        path=rich_knowledge_dir,
+        recursive=True,
+        context_lines=2,
+        fuzzy=False,
+        max_results=5,
+    )
+
+    assert "-m6" in cmd  # One past the limit to detect truncation
+    assert "--max-files=20" in cmd
+
+    file_cmd = search_engine._build_command(
+        query="test",
+        path=rich_knowledge_dir / "games" / "Guide.md",
+        recursive=False,
+        context_lines=2,
+        fuzzy=False,
+        max_results=5,
+    )
+
+    assert "-m6" in file_cmd
+    assert not any(arg.startswith("--max-files") for arg in file_cmd)
+
+
+@pytest.mark.asyncio
+async def test_build_command_tracks_format_changes(search_engine, rich_knowledge_dir):
+    """Test cached --include/--filter arguments are rebuilt when formats change."""
+    search_engine.config.formats["word_docx"].enabled = False
+    cmd = search_engine._build_command("test", rich_knowledge_dir, True, 2, False)
+    assert "*.docx" not in cmd
+
+    search_engine.config.formats["word_docx"].enabled = True
+    search_engine.config.invalidate_format_cache()
+    cmd = search_engine._build_command("test", rich_knowledge_dir, True, 2, False)
+    assert "*.docx" in cmd
+    assert any(arg.startswith("--filter=docx") for arg in cmd)
+
+
+@pytest.mark.asyncio
+async def test_build_command_keeps_extension_case(search_engine, rich_knowledge_dir):
+    """Test --include globs use extensions as configured, not lowercased."""
+    search_engine.config.formats["markdown"].extensions.append(".MD")
+    search_engine.config.invalidate_format_cache()
+    cmd = search_engine._build_command("test", rich_knowledge_dir, True, 2, False)
+    assert "*.MD" in cmd
+    assert "*.md" in cmd
+    assert search_engine.config.is_supported_extension(".Md")
+
+
 @pytest.mark.asyncio
 async def test_build_command_single_file(search_engine, rich_knowledge_dir):
     """Test _build_command for single file search."""
@@ -736,6 +810,22 @@ async def test_search_multiple_five_terms(rich_config, search_engine, rich_knowl
         assert "excerpts" in result["results"][term]
 
 
+@pytest.mark.skipif(not UG_AVAILABLE, reason="ugrep not installed")
+@pytest.mark.asyncio
+async def test_search_multiple_flags_truncated_counts(rich_config, search_engine):
+    """Test search_multiple marks match counts cut off at the per-term limit."""
+    doc = rich_config.knowledge.root / "many.md"
+    doc.write_text("".join(f"token line {i}\n" for i in range(30)) + "rare line\n")
+
+    args = {"document_path": "many.md", "terms": ["token", "rare"], "context_lines": 0}
+    result = await _search_multiple(rich_config, search_engine, args)
+
+    assert result["results"]["token"]["truncated"] is True
+    assert result["results"]["token"]["match_count"] > 10
+    assert result["results"]["rare"]["truncated"] is False
+    assert result["results"]["rare"]["match_count"] == 1
+
+
 @pytest.mark.asyncio
 async def test_search_multiple_no_results(rich_config, search_engine, rich_knowledge_dir):
     """Test search_multiple with term that has no matches."""
@@ -1,7 +1,12 @@
 """Tests for server lifecycle and setup."""
 
 from fathom_mcp.config import Config, KnowledgeConfig
-from fathom_mcp.server import ServerContext, create_server, get_document_index, get_server_context
+from fathom_mcp.server import (
+    ServerContext,
+    _cleanup_performance_features,
+    _initialize_performance_features,
+    create_server,
+)
 
 
 async def test_create_server(temp_knowledge_dir):
@@ -33,22 +38,19 @@ def test_server_context_initialization():
     assert context.config is None
 
 
-def test_get_server_context():
-    """Test get_server_context returns global context."""
-    context = get_server_context()
-
-    assert isinstance(context, ServerContext)
-
-
-def test_get_document_index_returns_none_initially():
-    """Test get_document_index returns None when no index is initialized."""
-    # Note: This test may fail if other tests have initialized the index
-    # In practice, document index is only initialized when performance features are enabled
-    index = get_document_index()
-
-    # Could be None or an instance depending on test execution order
-    # Just verify it doesn't raise an error
-    assert index is None or index is not None
+async def test_performance_features_use_given_context(temp_knowledge_dir):
+    """Test that each server's index lives in its own context, not module state."""
+    config = Config(knowledge=KnowledgeConfig(root=temp_knowledge_dir))
+    config.performance.enable_indexing = True
+    first = ServerContext(config=config)
+    second = ServerContext(config=config)
+
+    await _initialize_performance_features(config, first)
+    try:
+        assert first.document_index is not None
+        assert second.document_index is None
+    finally:
+        await _cleanup_performance_features(first)
 
 
 async def test_create_server_validates_filter_tools(temp_knowledge_dir):